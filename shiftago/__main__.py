@@ -1,4 +1,5 @@
 import sys
+import multiprocessing
 import platform
 import logging
 from datetime import datetime
@@ -53,6 +54,7 @@ def main() -> None:
         _logger.fatal("Uncaught exception!", exc_info=(exc_type, exc_value, exc_traceback))
         sys.exit(1)
 
+    multiprocessing.freeze_support()  # the AI engine may start worker processes
     sys.excepthook = handle_uncaught_exception
     app_config = read_config()
     _configure_logging(config=app_config.logging)
@@ -1,4 +1,5 @@
 import logging
+import os
 from configparser import ConfigParser, SectionProxy
 from dataclasses import dataclass
 from pathlib import Path
@@ -9,6 +10,10 @@ _CONFIG_FILE = 'shiftago-qt.cfg'
 _SECTION_SHIFTAGO = 'shiftago'
 _OPT_PREFERRED_COLOUR = 'preferred_colour'
 _OPT_SKILL_LEVEL = 'skill_level'
+_OPT_AI_WORKERS = 'ai_workers'
+
+# upper bound of the AI's worker processes: one logical CPU is left to the UI
+_MAX_AI_WORKERS = max(1, min(4, (os.cpu_count() or 1) - 1))
 
 _SECTION_LOGGING = 'logging'
 _OPT_LOGS_DIR = 'logs_dir'
@@ -25,9 +30,11 @@ class ShiftagoConfig:
     Attributes:
     preferred_colour (Colour): The preferred colour of the player.
     skill_level (SkillLevel): The skill level of the AI.
+    ai_workers (int): The number of processes the AI searches in parallel with.
     """
     preferred_colour: Colour = Colour.BLUE
     skill_level: SkillLevel = SkillLevel.ADVANCED
+    ai_workers: int = 1
 
 
 @dataclass
@@ -85,6 +92,25 @@ def _parse_skill_level(section: SectionProxy, fallback: SkillLevel) -> SkillLeve
     return fallback
 
 
+def _parse_ai_workers(section: SectionProxy, fallback: int) -> int:
+    """
+    Parses the number of AI worker processes from the configuration section.
+    It is limited to the number of logical CPUs minus one, but at most 4.
+    """
+    str_val = section.get(_OPT_AI_WORKERS, str(fallback))
+    try:
+        int_val = int(str_val)
+        if int_val >= 1:
+            if int_val > _MAX_AI_WORKERS:
+                _logger.warning("Option '%s' in section '%s' is limited to %d.",
+                                _OPT_AI_WORKERS, section.name, _MAX_AI_WORKERS)
+            return min(int_val, _MAX_AI_WORKERS)
+    except ValueError:
+        pass
+    _logger.error("Option '%s' in section '%s' has illegal value: %s", _OPT_AI_WORKERS, section.name, str_val)
+    return fallback
+
+
 def _parse_section_shiftago(config_parser: ConfigParser, shiftago_cfg: ShiftagoConfig) -> None:
     """
     Parses the Shiftago section from the configuration file and updates the ShiftagoConfig object.
@@ -93,6 +119,7 @@ def _parse_section_shiftago(config_parser: ConfigParser, shiftago_cfg: ShiftagoC
         section = config_parser[_SECTION_SHIFTAGO]
         shiftago_cfg.preferred_colour = _parse_preferred_colour(section, shiftago_cfg.preferred_colour)
         shiftago_cfg.skill_level = _parse_skill_level(section, shiftago_cfg.skill_level)
+        shiftago_cfg.ai_workers = _parse_ai_workers(section, shiftago_cfg.ai_workers)
     except KeyError:
         _logger.warning("Section '%s' not present in configuration file.", _SECTION_SHIFTAGO)
 
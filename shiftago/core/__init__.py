@@ -1,10 +1,11 @@
 # pylint: disable=consider-using-f-string
-from typing import List, Dict, Set, Sequence, Optional, TextIO, Tuple, Type, TypeVar, Generic, Iterator
+from typing import List, Dict, Set, Sequence, Optional, TextIO, Tuple, Type, TypeVar, Generic, Iterator, \
+    Iterable
 from abc import ABC, abstractmethod
 from enum import Enum
 from collections import namedtuple, deque
-from functools import total_ordering
 import json
+import random
 from io import StringIO
 
 NUM_SLOTS_PER_SIDE = 7
@@ -117,18 +118,21 @@ class Side(Enum):
         return self.TOP
 
 
-@total_ordering
-class Slot(namedtuple('Slot', 'hor_pos ver_pos')):
+class Slot(int):
     """
     Slot represents a position on the game board with horizontal and vertical coordinates.
-    It uses the total_ordering decorator to provide comparison methods based on the 
-    coordinates, allowing slots to be compared and sorted.
+    It is an int, the flat index ver_pos * NUM_SLOTS_PER_SIDE + hor_pos of the slot, which is
+    also its bit number in a bitboard (see Shiftago.bitboard). So slots are hashed and compared
+    like ints and are sorted by their vertical and then their horizontal position.
 
     Attributes:
     hor_pos (int): The horizontal position of the slot.
     ver_pos (int): The vertical position of the slot.
     """
 
+    hor_pos: int
+    ver_pos: int
+
     _instances = [[None for _ in range(NUM_SLOTS_PER_SIDE)]
                   for _ in range(NUM_SLOTS_PER_SIDE)]  # type: List[List[Optional[Slot]]]
 
@@ -141,18 +145,21 @@ class Slot(namedtuple('Slot', 'hor_pos ver_pos')):
         slot = cls._instances[ver_pos][hor_pos]
 
         if slot is None:
-            slot = super().__new__(cls, hor_pos, ver_pos)
+            slot = super().__new__(cls, ver_pos * NUM_SLOTS_PER_SIDE + hor_pos)
+            slot.hor_pos = hor_pos
+            slot.ver_pos = ver_pos
             cls._instances[ver_pos][hor_pos] = slot
         return slot
 
+    def __getnewargs__(self) -> Tuple[int, int]:  # type: ignore[override]
+        return self.hor_pos, self.ver_pos
+
+    def __repr__(self) -> str:
+        return "Slot(hor_pos={0}, ver_pos={1})".format(self.hor_pos, self.ver_pos)
+
     def __str__(self) -> str:
         return "[{0},{1}]".format(self.hor_pos, self.ver_pos)
 
-    def __lt__(self, other) -> bool:
-        if self.ver_pos < other.ver_pos:
-            return True
-        return self.ver_pos == other.ver_pos and self.hor_pos < other.hor_pos
-
     def neighbour(self, direction: Side) -> 'Slot':
         """
         Returns the neighbouring Slot in the specified direction.
@@ -192,17 +199,26 @@ class LineOrientation(Enum):
     ASCENDING = 2
     DESCENDING = 3
 
-    def to_neighbour(self, slot: Slot) -> Slot:
+    @property
+    def direction(self) -> Tuple[int, int]:
         """
-        Returns the neighbouring Slot object in the direction of the line orientation.
+        Returns the horizontal and vertical distance from a slot to its neighbour in the direction
+        of the line orientation.
         """
         if self == self.HORIZONTAL:
-            return Slot(slot.hor_pos + 1, slot.ver_pos)
+            return 1, 0
         if self == self.VERTICAL:
-            return Slot(slot.hor_pos, slot.ver_pos + 1)
+            return 0, 1
         if self == self.ASCENDING:
-            return Slot(slot.hor_pos + 1, slot.ver_pos - 1)
-        return Slot(slot.hor_pos + 1, slot.ver_pos + 1)
+            return 1, -1
+        return 1, 1
+
+    def to_neighbour(self, slot: Slot) -> Slot:
+        """
+        Returns the neighbouring Slot object in the direction of the line orientation.
+        """
+        hor_step, ver_step = self.direction
+        return Slot(slot.hor_pos + hor_step, slot.ver_pos + ver_step)
 
 
 class SlotsInLine:
@@ -226,6 +242,16 @@ class SlotsInLine:
                 yield slot
         self._slots = tuple(generate_line())
 
+    @classmethod
+    def _unchecked(cls, orientation: LineOrientation, slots: Tuple[Slot, ...]) -> 'SlotsInLine':
+        """
+        Creates a SlotsInLine instance directly from its slots, which must form a line with the given orientation.
+        """
+        line = object.__new__(cls)
+        line._orientation = orientation
+        line._slots = slots
+        return line
+
     def __eq__(self, other) -> bool:
         if isinstance(other, SlotsInLine):
             return self._slots == other._slots
@@ -259,27 +285,15 @@ class SlotsInLine:
         starting from every possible slot on the board.
         """
         all_lines = set()  # type: Set[SlotsInLine]
-
-        def add_all_sub_lines(start_slot: Slot, orientation: LineOrientation, board_line_length: int):
-            for _ in range(0, board_line_length - line_length + 1):
-                all_lines.add(SlotsInLine(orientation, line_length, start_slot))
-                start_slot = orientation.to_neighbour(start_slot)
-
-        for orientation in (LineOrientation.HORIZONTAL, LineOrientation.VERTICAL):
-            for offset in range(0, NUM_SLOTS_PER_SIDE):
-                add_all_sub_lines(Slot(0, offset) if orientation == LineOrientation.HORIZONTAL else
-                                  Slot(offset, 0), orientation, NUM_SLOTS_PER_SIDE)
-
-        for orientation in (LineOrientation.DESCENDING, LineOrientation.ASCENDING):
-            max_offset = NUM_SLOTS_PER_SIDE - line_length
-            for offset in range(0, max_offset + 1):
-                add_all_sub_lines(Slot(0, offset if orientation == LineOrientation.DESCENDING else
-                                       NUM_SLOTS_PER_SIDE - 1 - offset), orientation,
-                                  NUM_SLOTS_PER_SIDE - offset)
-            for offset in range(1, max_offset + 1):
-                add_all_sub_lines(Slot(offset, 0 if orientation == LineOrientation.DESCENDING else
-                                       NUM_SLOTS_PER_SIDE - 1), orientation,
-                                  NUM_SLOTS_PER_SIDE - offset)
+        for orientation in LineOrientation:
+            hor_step, ver_step = orientation.direction
+            for start_slot in _SLOTS:
+                # a line starts at every slot from which its last slot is still on the board
+                if 0 <= start_slot.hor_pos + (line_length - 1) * hor_step < NUM_SLOTS_PER_SIDE and \
+                        0 <= start_slot.ver_pos + (line_length - 1) * ver_step < NUM_SLOTS_PER_SIDE:
+                    all_lines.add(SlotsInLine._unchecked(orientation, tuple(
+                        Slot(start_slot.hor_pos + i * hor_step, start_slot.ver_pos + i * ver_step)
+                        for i in range(line_length))))
         return all_lines
 
 
@@ -373,6 +387,37 @@ class JSONEncoder(json.JSONEncoder):
                                         for ver_pos in range(NUM_SLOTS_PER_SIDE)]}
 
 
+def _generate_zobrist_keys() -> Tuple[Dict[Colour, List[int]], Dict[Colour, int]]:
+    """
+    Generates the random 64 bit keys from which the Zobrist key of a game state is composed:
+    one per colour and slot (indexed by the slot) and one per colour to move.
+    A fixed seed makes the keys the same in every process.
+    """
+    rnd = random.Random(0x5A1F7A60)
+    slot_keys = {colour: [rnd.getrandbits(64) for _ in range(NUM_SLOTS_PER_SIDE * NUM_SLOTS_PER_SIDE)]
+                 for colour in Colour}
+    colour_to_move_keys = {colour: rnd.getrandbits(64) for colour in Colour}
+    return slot_keys, colour_to_move_keys
+
+
+_ZOBRIST_SLOT_KEYS, _ZOBRIST_COLOUR_TO_MOVE_KEYS = _generate_zobrist_keys()
+
+_SIDES = tuple(Side)
+
+# all slots indexed by themselves
+_SLOTS = tuple(Slot(index % NUM_SLOTS_PER_SIDE, index // NUM_SLOTS_PER_SIDE)
+               for index in range(NUM_SLOTS_PER_SIDE * NUM_SLOTS_PER_SIDE))
+# per side, the difference between a slot and its neighbour farther away from the side
+_SLOT_STEPS = {side: side.shift_direction if side.is_vertical else side.shift_direction * NUM_SLOTS_PER_SIDE
+               for side in Side}
+
+# the slots of each row (indexed by ver_pos) and each column (indexed by hor_pos) as bitboard masks
+_ROW_MASKS = tuple(sum(1 << (ver_pos * NUM_SLOTS_PER_SIDE + hor_pos) for hor_pos in range(NUM_SLOTS_PER_SIDE))
+                   for ver_pos in range(NUM_SLOTS_PER_SIDE))
+_COLUMN_MASKS = tuple(sum(1 << (ver_pos * NUM_SLOTS_PER_SIDE + hor_pos) for ver_pos in range(NUM_SLOTS_PER_SIDE))
+                      for hor_pos in range(NUM_SLOTS_PER_SIDE))
+
+
 ShiftagoT = TypeVar('ShiftagoT', bound='Shiftago')
 """
 ShiftagoT is a type variable that is bound to the Shiftago class.
@@ -463,6 +508,8 @@ class Shiftago(ABC):
         if orig is not None:
             self._colours = orig._colours.copy()
             self._board = orig._board.copy()
+            self._board_key = orig._board_key
+            self._bitboards = orig._bitboards.copy()
             if colours is not None:
                 raise ValueError("Parameters 'orig' and 'colours' exclude each other!")
             if board is not None:
@@ -476,6 +523,11 @@ class Shiftago(ABC):
                 self._board = {}  # type: Dict[Slot, Colour]
             else:
                 self._board = board
+            self._board_key = 0
+            self._bitboards = {colour: 0 for colour in Colour}  # type: Dict[Colour, int]
+            for slot, colour in self._board.items():
+                self._board_key ^= _ZOBRIST_SLOT_KEYS[colour][slot]
+                self._bitboards[colour] |= 1 << slot
 
     def __str__(self) -> str:
         string_io = StringIO()
@@ -514,6 +566,8 @@ class Shiftago(ABC):
         self._validate_colours(colours)
         self._colours = deque(colours)
         self._board.clear()
+        self._board_key = 0
+        self._bitboards = {colour: 0 for colour in Colour}
 
     @property
     def colour_to_move(self) -> Colour:
@@ -524,6 +578,14 @@ class Shiftago(ABC):
         assert self.game_over_condition is None, "Game is already over!"
         return self._colours[0]
 
+    @property
+    def zobrist_key(self) -> int:
+        """
+        Returns the Zobrist key of the game state, a 64 bit hash of the board and the colour to move
+        that is updated incrementally with every move.
+        """
+        return self._board_key ^ _ZOBRIST_COLOUR_TO_MOVE_KEYS[self._colours[0]]
+
     @property
     @abstractmethod
     def game_over_condition(self) -> Optional[GameOverCondition]:
@@ -543,6 +605,19 @@ class Shiftago(ABC):
                 slot = Slot(hor_pos, ver_pos)
                 yield slot, self._board.get(slot)
 
+    def bitboard(self, colour: Colour) -> int:
+        """
+        Returns the slots occupied by the specified colour as a bitboard: the bit
+        numbered by the slot (ver_pos * NUM_SLOTS_PER_SIDE + hor_pos) is set for each occupied slot.
+        """
+        return self._bitboards[colour]
+
+    def occupied_slots(self) -> Iterable[Tuple[Slot, Colour]]:
+        """
+        Returns all occupied slots on the game board along with their colours, in no particular order.
+        """
+        return self._board.items()
+
     def colour_at(self, position: Slot) -> Optional[Colour]:
         """
         Returns the colour of the marble at the specified slot position on the game board.
@@ -580,7 +655,7 @@ class Shiftago(ABC):
         The condition of the game after the move is applied, or None if the game is not over.
         """
 
-    def _insert_marble(self, side: Side, position: int, observer: MoveObserver) -> None:
+    def _insert_marble(self, side: Side, position: int, observer: MoveObserver) -> Slot:
         """
         Inserts a marble into the game board from the specified side and position, shifting other marbles as necessary.
         Notifies the observer of marble shifts and insertions.
@@ -589,23 +664,54 @@ class Shiftago(ABC):
         side: The side of the board from which the marble is inserted.
         position: The position along the specified side where the marble is inserted.
         observer: An observer to be notified of marble shift and insertion events.
+
+        Returns:
+        The formerly empty slot that has been filled by shifting (or inserting) a marble.
         """
         first_empty_slot = self.find_first_empty_slot(side, position)  # type: Optional[Slot]
         assert first_empty_slot is not None, "No empty slot!"
-        if side.is_vertical:
-            for hor_pos in range(first_empty_slot.hor_pos, side.position, -side.shift_direction):
-                occupied = Slot(hor_pos - side.shift_direction, position)
-                self._board[Slot(hor_pos, position)] = self.colour_of_occupied_slot(occupied)
-                observer.notify_marble_shifted(occupied, side.opposite)
-            insert_slot = Slot(side.position, position)
-        else:
-            for ver_pos in range(first_empty_slot.ver_pos, side.position, -side.shift_direction):
-                occupied = Slot(position, ver_pos - side.shift_direction)
-                self._board[Slot(position, ver_pos)] = self.colour_of_occupied_slot(occupied)
-                observer.notify_marble_shifted(occupied, side.opposite)
-            insert_slot = Slot(position, side.position)
-        self._board[insert_slot] = self._colours[0]
+        board = self._board
+        board_key = self._board_key
+        bitboards = self._bitboards
+        insert_slot = Slot.on_edge(side, position)
+        step = _SLOT_STEPS[side]
+        for index in range(first_empty_slot, insert_slot, -step):
+            occupied = _SLOTS[index - step]
+            colour = board[occupied]
+            board[_SLOTS[index]] = colour
+            keys = _ZOBRIST_SLOT_KEYS[colour]
+            board_key ^= keys[occupied] ^ keys[index]
+            bitboards[colour] ^= (1 << occupied) | (1 << index)
+            observer.notify_marble_shifted(occupied, side.opposite)
+        colour = self._colours[0]
+        board[insert_slot] = colour
+        self._board_key = board_key ^ _ZOBRIST_SLOT_KEYS[colour][insert_slot]
+        bitboards[colour] |= 1 << insert_slot
         observer.notify_marble_inserted(insert_slot)
+        return first_empty_slot
+
+    def _remove_marble(self, side: Side, position: int, filled_slot: Slot, board_key: int) -> None:
+        """
+        Reverts _insert_marble: removes the marble inserted from the specified side and position
+        and shifts the other marbles back.
+
+        Parameters:
+        side: The side of the board from which the marble has been inserted.
+        position: The position along the specified side where the marble has been inserted.
+        filled_slot: The slot returned by _insert_marble.
+        board_key: The Zobrist key of the board before the marble has been inserted.
+        """
+        board = self._board
+        bitboards = self._bitboards
+        insert_slot = Slot.on_edge(side, position)
+        step = _SLOT_STEPS[side]
+        bitboards[board[insert_slot]] ^= 1 << insert_slot
+        for index in range(insert_slot, filled_slot, step):
+            colour = board[_SLOTS[index + step]]
+            board[_SLOTS[index]] = colour
+            bitboards[colour] ^= (1 << (index + step)) | (1 << index)
+        del board[filled_slot]
+        self._board_key = board_key
 
     def find_first_empty_slot(self, side: Side, insert_pos: int) -> Optional[Slot]:
         """
@@ -618,28 +724,22 @@ class Shiftago(ABC):
         Returns:
         The first empty Slot object if found, else None.
         """
-        if side.is_vertical:
-            for hor_pos in (range(NUM_SLOTS_PER_SIDE) if side == Side.LEFT else
-                            range(NUM_SLOTS_PER_SIDE - 1, -1, -1)):
-                position = Slot(hor_pos, insert_pos)
-                if self.colour_at(position) is None:
-                    return position
-        else:
-            for ver_pos in (range(NUM_SLOTS_PER_SIDE) if side == Side.TOP else
-                            range(NUM_SLOTS_PER_SIDE - 1, -1, -1)):
-                position = Slot(insert_pos, ver_pos)
-                if self.colour_at(position) is None:
-                    return position
+        occupied = 0
+        for bitboard in self._bitboards.values():
+            occupied |= bitboard
+        index = Slot.on_edge(side, insert_pos)  # type: int
+        step = _SLOT_STEPS[side]
+        for _ in range(NUM_SLOTS_PER_SIDE):
+            if not occupied >> index & 1:
+                return _SLOTS[index]
+            index += step
         return None
 
     def count_slots_per_colour(self) -> Dict[Colour, int]:
         """
         Counts the number of slots occupied by each colour on the game board.
         """
-        slots_per_colour = {c: 0 for c in self._colours}
-        for c in self._board.values():
-            slots_per_colour[c] += 1
-        return slots_per_colour
+        return {c: self._bitboards[c].bit_count() for c in self._colours}
 
     def count_occupied_slots(self) -> int:
         """
@@ -652,17 +752,39 @@ class Shiftago(ABC):
         Detects all possible moves that can be made on the game board. A move is possible
         if there is at least one empty slot in the corresponding row or column.
         """
+        occupied = 0
+        for bitboard in self._bitboards.values():
+            occupied |= bitboard
         results = []  # type: List[Move]
-        for hor_pos in range(NUM_SLOTS_PER_SIDE):
-            if self.find_first_empty_slot(Side.TOP, hor_pos) is not None:
+        for hor_pos, column_mask in enumerate(_COLUMN_MASKS):
+            if occupied & column_mask != column_mask:
                 results.append(Move(Side.TOP, hor_pos))
                 results.append(Move(Side.BOTTOM, hor_pos))
-        for ver_pos in range(NUM_SLOTS_PER_SIDE):
-            if self.find_first_empty_slot(Side.LEFT, ver_pos) is not None:
+        for ver_pos, row_mask in enumerate(_ROW_MASKS):
+            if occupied & row_mask != row_mask:
                 results.append(Move(Side.LEFT, ver_pos))
                 results.append(Move(Side.RIGHT, ver_pos))
         return results
 
+    def sample_possible_move(self, rnd: Optional[random.Random] = None) -> Move:
+        """
+        Selects one of the possible moves at random, each of them with the same probability, without detecting
+        all of them. A side and a position are drawn until the corresponding row or column has an empty slot.
+
+        Parameters:
+        rnd: The random number generator to be used (default is the one of the module random).
+        """
+        choice = (random if rnd is None else rnd).choice
+        occupied = 0
+        for bitboard in self._bitboards.values():
+            occupied |= bitboard
+        positions = range(NUM_SLOTS_PER_SIDE)
+        while True:
+            side, position = choice(_SIDES), choice(positions)
+            mask = _ROW_MASKS[position] if side.is_vertical else _COLUMN_MASKS[position]
+            if occupied & mask != mask:
+                return Move(side, position)
+
 
 class SkillLevel(Enum):
     """
@@ -1,10 +1,16 @@
 # pylint: disable=consider-using-f-string
-from typing import Dict, Set, Sequence, Optional, TextIO
-from collections import defaultdict
+from typing import List, Tuple, Dict, Set, Sequence, Optional, TextIO
 from shiftago.core import NUM_MARBLES_PER_COLOUR, NUM_SLOTS_PER_SIDE
 from shiftago.core import ShiftagoDeser, Slot, Colour, SlotsInLine, Shiftago, Move, \
     MoveObserver, GameOverCondition
 
+GAME_ONGOING = 0
+"""The game status after a move that has not ended the game."""
+GAME_DRAWN = 1
+"""The game status after a move that has ended the game in a draw."""
+GAME_WON = 2
+"""The game status after a move that has been won by the player who has made it."""
+
 
 class WinningLinesDetector:
     """
@@ -18,10 +24,16 @@ class WinningLinesDetector:
         if not 4 <= winning_match_degree <= 5:
             raise ValueError("Illegal winning line length: {0}".format(winning_match_degree))
         self._winning_match_degree = winning_match_degree
-        self._slot_to_lines = defaultdict(set)  # type: Dict[Slot, Set[SlotsInLine]]
-        for line in SlotsInLine.get_all(winning_match_degree):
+        self._lines = tuple(sorted(SlotsInLine.get_all(winning_match_degree), key=lambda line: line.slots))
+        # the slots of each line as a bitboard mask (see Shiftago.bitboard), indexed like self._lines
+        self._line_masks = tuple(sum(1 << slot for slot in line.slots) for line in self._lines)
+        self._lines_with_masks = tuple(zip(self._lines, self._line_masks))
+        slot_to_lines = {}  # type: Dict[Slot, List[SlotsInLine]]
+        for line in self._lines:
             for slot in line.slots:
-                self._slot_to_lines[slot].add(line)
+                slot_to_lines.setdefault(slot, []).append(line)
+        self._slot_to_lines = {slot: tuple(lines) for slot, lines
+                               in slot_to_lines.items()}  # type: Dict[Slot, Tuple[SlotsInLine, ...]]
 
     @property
     def winning_match_degree(self) -> int:
@@ -31,9 +43,9 @@ class WinningLinesDetector:
         return self._winning_match_degree
 
     @property
-    def slot_to_lines(self) -> Dict[Slot, Set[SlotsInLine]]:
+    def slot_to_lines(self) -> Dict[Slot, Tuple[SlotsInLine, ...]]:
         """
-        Returns a mapping from each slot to the set of potential winning lines that include that slot.
+        Returns a mapping from each slot to the potential winning lines that include that slot.
         """
         return self._slot_to_lines
 
@@ -54,15 +66,41 @@ class WinningLinesDetector:
         """
         if min_match_degree is None:
             min_match_degree = self._winning_match_degree
-        match_degrees_per_colour = {colour: defaultdict(lambda: 0) for colour in
-                                    shiftago.colours}  # type: Dict[Colour, Dict[SlotsInLine, int]]
-        for slot, colour in shiftago.slots():
-            if colour is not None:
-                match_degrees = match_degrees_per_colour[colour]
-                for line in self._slot_to_lines[slot]:
-                    match_degrees[line] += 1
-        return tuple({line: match_degree for line, match_degree in match_degrees_per_colour[colour].items()
-                      if match_degree >= min_match_degree} for colour in shiftago.colours)
+        # the match degree of a line is the number of bits its mask has in common with the colour's bitboard
+        results = []  # type: List[Dict[SlotsInLine, int]]
+        for colour in shiftago.colours:
+            bitboard = shiftago.bitboard(colour)
+            match_degrees = {}  # type: Dict[SlotsInLine, int]
+            for line, mask in self._lines_with_masks:
+                match_degree = (bitboard & mask).bit_count()
+                if match_degree >= min_match_degree:
+                    match_degrees[line] = match_degree
+            results.append(match_degrees)
+        return tuple(results)
+
+    def count_match_degrees(self, shiftago: Shiftago, min_match_degree: int = 1) -> Sequence[List[int]]:
+        """
+        Counts the potential winning lines per match degree for each colour. Unlike determine_match_degrees,
+        it doesn't build a mapping of the lines themselves.
+
+        Parameters:
+        shiftago: The current state of the game.
+        min_match_degree: The minimum match degree to consider.
+
+        Returns:
+        A sequence of lists where each list corresponds to a colour and maps each match degree
+        (as index, up to the winning match degree) to the number of lines with that degree.
+        """
+        results = []  # type: List[List[int]]
+        for colour in shiftago.colours:
+            bitboard = shiftago.bitboard(colour)
+            counts = [0] * (self._winning_match_degree + 1)
+            for mask in self._line_masks:
+                counts[(bitboard & mask).bit_count()] += 1
+            for match_degree in range(min_match_degree):
+                counts[match_degree] = 0
+            results.append(counts)
+        return tuple(results)
 
     def has_winning_line(self, shiftago: Shiftago, colour: Colour) -> bool:
         """
@@ -77,8 +115,9 @@ class WinningLinesDetector:
         Returns:
         True if the specified colour has a winning line, False otherwise.
         """
-        for match_degree in self._build_match_degrees(shiftago, colour).values():
-            if match_degree == self._winning_match_degree:
+        bitboard = shiftago.bitboard(colour)
+        for mask in self._line_masks:
+            if bitboard & mask == mask:
                 return True
         return False
 
@@ -95,17 +134,8 @@ class WinningLinesDetector:
         Returns:
         A set of winning lines for the specified colour.
         """
-        match_degrees = self._build_match_degrees(shiftago, colour)
-        return set(filter(lambda line: match_degrees[line] == self._winning_match_degree,
-                          match_degrees.keys()))
-
-    def _build_match_degrees(self, shiftago: Shiftago, colour: Colour) -> Dict[SlotsInLine, int]:
-        match_degrees = defaultdict(lambda: 0)  # type: Dict[SlotsInLine, int]
-        for slot, slot_col in shiftago.slots():
-            if slot_col == colour:
-                for line in self._slot_to_lines[slot]:
-                    match_degrees[line] += 1
-        return match_degrees
+        bitboard = shiftago.bitboard(colour)
+        return {line for line, mask in self._lines_with_masks if bitboard & mask == mask}
 
 
 class ShiftagoExpress(Shiftago):
@@ -138,13 +168,19 @@ class ShiftagoExpress(Shiftago):
         """
         super().__init__(orig=orig, colours=colours, board=board)
         if orig is not None:
+            self._game_status = orig._game_status
             self._game_over_condition = orig._game_over_condition
             self._winning_lines_detector = orig._winning_lines_detector
+            self._winning_line_length = orig._winning_line_length
         else:
             if colours is None:
                 raise ValueError("Parameters 'colours' is mandatory if 'orig' is None!")
             self._winning_lines_detector = self._select_winning_lines_detector(colours)
-            self._game_over_condition = None
+            self._winning_line_length = self._winning_lines_detector.winning_match_degree
+            self._game_status = GAME_ONGOING
+            self._game_over_condition = None  # type: Optional[GameOverCondition]
+        # (move, slot filled by the move, Zobrist key of the board before the move) per revertible move
+        self._undo_stack = []  # type: List[Tuple[Move, Slot, int]]
 
     @Shiftago.colours.setter
     def colours(self, new_colours: Sequence[Colour]):
@@ -153,14 +189,17 @@ class ShiftagoExpress(Shiftago):
         """
         super()._set_colours(new_colours)
         self._winning_lines_detector = self._select_winning_lines_detector(new_colours)
+        self._winning_line_length = self._winning_lines_detector.winning_match_degree
+        self._game_status = GAME_ONGOING
         self._game_over_condition = None
+        self._undo_stack.clear()
 
     @property
     def winning_line_length(self) -> int:
         """
         Returns the length of the winning line required to win the game.
         """
-        return self._winning_lines_detector.winning_match_degree
+        return self._winning_line_length
 
     @property
     def game_over_condition(self) -> Optional[GameOverCondition]:
@@ -170,8 +209,21 @@ class ShiftagoExpress(Shiftago):
         Returns:
         An 'game over' condition if the game is over, None otherwise.
         """
+        if self._game_status == GAME_ONGOING:
+            return None
+        if self._game_over_condition is None:
+            # created on demand, so that searching the game tree doesn't create one per game state
+            self._game_over_condition = GameOverCondition(self._colours[0] if self._game_status == GAME_WON
+                                                          else None)
         return self._game_over_condition
 
+    @property
+    def game_status(self) -> int:
+        """
+        Returns the status of the game: GAME_ONGOING, GAME_DRAWN or GAME_WON.
+        """
+        return self._game_status
+
     def __copy__(self) -> 'ShiftagoExpress':
         """
         Creates a copy of the current game state.
@@ -194,27 +246,59 @@ class ShiftagoExpress(Shiftago):
         Raises:
         AssertionError: If the game is already over.
         """
-        assert self._game_over_condition is None, "Game is already over!"
+        self.make_move(move, observer)
+        return self.game_over_condition
 
-        colour_to_move = self.colour_to_move
-        self._insert_marble(move.side, move.position, observer)
+    def make_move(self, move: Move, observer: MoveObserver = Shiftago._DEFAULT_MOVE_OBSERVER) -> int:
+        """
+        Applies the given move like apply_move, but returns the game status instead of a
+        'game over' condition. Like any applied move, it can be reverted by undo_move.
+
+        Returns:
+        GAME_WON if the move has won the game, GAME_DRAWN if it has ended the game in a draw,
+        GAME_ONGOING otherwise.
+
+        Raises:
+        AssertionError: If the game is already over.
+        """
+        assert self._game_status == GAME_ONGOING, "Game is already over!"
+
+        colour_to_move = self._colours[0]
+        board_key = self._board_key
+        self._undo_stack.append((move, self._insert_marble(move.side, move.position, observer), board_key))
 
         # check if the match has been won by the move
         if self._winning_lines_detector.has_winning_line(self, colour_to_move):
-            self._game_over_condition = GameOverCondition(colour_to_move)
+            self._game_status = GAME_WON
         else:
             num_slots_per_colour = self.count_slots_per_colour()
             # check if there is a free slot left
             if sum(num_slots_per_colour.values()) < NUM_SLOTS_PER_SIDE * NUM_SLOTS_PER_SIDE:
                 # check if the colour to move next has one available marble at least
                 if num_slots_per_colour[self._colours[1]] == NUM_MARBLES_PER_COLOUR:
-                    self._game_over_condition = GameOverCondition()
+                    self._game_status = GAME_DRAWN
                 else:
                     self._colours.rotate(-1)  # switch colour to move
             else:
                 # all slots are occupied
-                self._game_over_condition = GameOverCondition()
-        return self._game_over_condition
+                self._game_status = GAME_DRAWN
+        return self._game_status
+
+    def undo_move(self) -> None:
+        """
+        Reverts the last move that has been applied to this game state and not yet been reverted.
+        This allows searching the game tree on a single game state instead of a copy per move.
+
+        Raises:
+        IndexError: If there is no move to be reverted.
+        """
+        move, filled_slot, board_key = self._undo_stack.pop()
+        if self._game_status == GAME_ONGOING:
+            self._colours.rotate(1)  # switch back to the colour that has made the move
+        else:
+            self._game_status = GAME_ONGOING
+            self._game_over_condition = None
+        self._remove_marble(move.side, move.position, filled_slot, board_key)
 
     def detect_winning_lines(self, min_match_count: Optional[int] = None) -> Sequence[Dict[SlotsInLine, int]]:
         """
@@ -230,14 +314,28 @@ class ShiftagoExpress(Shiftago):
         """
         return self._winning_lines_detector.determine_match_degrees(self, min_match_count)
 
+    def count_matches(self, min_match_count: int = 2) -> Sequence[List[int]]:
+        """
+        Counts the potential winning lines on the game board per match degree for each colour.
+
+        Parameters:
+        min_match_count: The minimum match degree to consider.
+
+        Returns:
+        A sequence of lists where each list corresponds to a colour and maps each match degree
+        (as index, up to the winning line length) to the number of lines with that degree.
+        """
+        return self._winning_lines_detector.count_match_degrees(self, min_match_count)
+
     def winning_lines_of_winner(self) -> Set[SlotsInLine]:
         """
         Determines the set of winning lines for the winning colour on the game board.
         Raises:
         AssertionError: If the game is not over or there is no winner.
         """
-        assert self._game_over_condition is not None and self._game_over_condition.winner is not None
-        return self._winning_lines_detector.winning_lines_of(self, self._game_over_condition.winner)
+        game_over_condition = self.game_over_condition
+        assert game_over_condition is not None and game_over_condition.winner is not None
+        return self._winning_lines_detector.winning_lines_of(self, game_over_condition.winner)
 
     @classmethod
     def deserialize(cls, input_stream: TextIO) -> 'ShiftagoExpress':
@@ -1,19 +1,20 @@
 # pylint: disable=consider-using-f-string
 import logging
 import math
-import random
 import copy
-from collections import defaultdict, namedtuple
-from typing import List, Tuple, Optional, Sequence, Dict
-from abc import ABC, abstractmethod
+import heapq
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, Future
+from collections import namedtuple
+from typing import List, Tuple, Optional, Sequence, Dict, Callable, Any, Iterator
 from functools import lru_cache
 from shiftago.core import AIEngine, SkillLevel
-from .express import ShiftagoExpress, Move, GameOverCondition
+from .express import ShiftagoExpress, Move, GAME_ONGOING, GAME_WON
 
 _logger = logging.getLogger(__name__)
 
 
-def analyze_colour_placements(game_state: ShiftagoExpress) -> Sequence[Dict[int, int]]:
+def analyze_colour_placements(game_state: ShiftagoExpress) -> Sequence[List[int]]:
     """
     Analyzes the placement of colors on the game board and detects potential winning lines for each player.
 
@@ -21,16 +22,11 @@ def analyze_colour_placements(game_state: ShiftagoExpress) -> Sequence[Dict[int,
     game_state: The current state of the game.
 
     Returns:
-    A sequence of dictionaries where each dictionary corresponds to a player and maps 
-    match group indices to the number of times they appear in potential winning lines.
+    A sequence of lists where each list corresponds to a player and maps each match degree
+    (as index, up to the winning line length) to the number of potential winning lines with that degree.
+    Match degrees below 2 are not counted.
     """
-    # Detect winning lines for each player
-    winning_line_matches = game_state.detect_winning_lines(2)
-    results = tuple(defaultdict(lambda: 0) for _ in winning_line_matches)  # type: Sequence[Dict[int, int]]
-    for player_idx, match_groups_of_player in enumerate(results):
-        for match_group_index in winning_line_matches[player_idx].values():
-            match_groups_of_player[match_group_index] = match_groups_of_player[match_group_index] + 1
-    return results
+    return game_state.count_matches(2)
 
 
 class _Rating(namedtuple('Rating', 'value depth')):
@@ -44,26 +40,35 @@ class _Rating(namedtuple('Rating', 'value depth')):
     depth (int): The depth in the game tree at which the rating was determined.
     """
 
+    __slots__ = ()
+
 
 class _Node:
     """
     _Node represents a node in the game tree for the Alpha-Beta pruning algorithm. 
     Each node corresponds to a game state resulting from a specific move. 
-    It stores the move that led to this game state, the resulting game state, 
-    and whether the game is over after this move.
+    It stores the move that led to this game state, whether the game is over
+    after this move and the static evaluation of the resulting game state.
+    The game state itself is not kept: the move is applied to the game state of
+    the parent node and reverted after the evaluation.
     """
 
-    def __init__(self, from_game_state: ShiftagoExpress, move: Move) -> None:
+    __slots__ = ('_move', '_game_status', '_rating')
+
+    def __init__(self, move: Move, game_status: int, rating: float) -> None:
+        self.reset(move, game_status, rating)
+
+    def reset(self, move: Move, game_status: int, rating: float) -> None:
+        """
+        Reinitializes this node, so that it can be reused for another move.
+        """
         self._move = move
-        self._target_game_state = copy.copy(from_game_state)
-        self._game_over_condition = self._target_game_state.apply_move(move)
+        self._game_status = game_status
+        self._rating = rating
 
     def __str__(self) -> str:
         return "(move: {0}, is_leaf: {1})".format(self._move, self.is_leaf)
 
-    def __hash__(self) -> int:
-        return hash(self._move)
-
     @property
     def move(self) -> Move:
         """
@@ -72,130 +77,85 @@ class _Node:
         return self._move
 
     @property
-    def target_game_state(self) -> ShiftagoExpress:
+    def game_status(self) -> int:
         """
-        Returns the resulting game state after applying the move.
+        Returns the status of the game after this move: GAME_ONGOING, GAME_DRAWN or GAME_WON.
         """
-        return self._target_game_state
+        return self._game_status
 
     @property
-    def game_over_condition(self) -> Optional[GameOverCondition]:
+    def rating(self) -> float:
         """
-        Indicates whether the game is over after this move. If the game is not over,
-        this property will be None.
+        Returns the static evaluation of the game state after this move from the perspective
+        of the player who has made the move.
         """
-        return self._game_over_condition
+        return self._rating
 
     @property
     def is_leaf(self) -> bool:
         """
         Indicates whether this node is a leaf node in the game tree.
         """
-        return self._game_over_condition is not None
+        return self._game_status != GAME_ONGOING
 
 
-class _MiniMaxStrategy(ABC):
+@lru_cache(maxsize=None)
+def _rating_function(winning_line_length: int) -> Callable[[List[int], List[int]], float]:
     """
-    _MiniMaxStrategy is an abstract base class for implementing the minimax strategy 
-    with Alpha-Beta pruning. It defines common properties and methods used by both 
-    maximizing and minimizing strategies in the game tree search.
+    Generates the function that computes the rating value of a game state from the placements
+    of the current player and the opponent (see analyze_colour_placements) for the given winning
+    line length. Its body is a single expression with one precomputed constant weight per match degree,
+    so no loop and no power has to be computed per evaluation.
     """
+    terms = " + ".join("(current[{0}] - opponent[{0}]) * {1!r}".format(i, math.pow(10, -(winning_line_length - i + 1)))
+                       for i in range(winning_line_length, 1, -1))
+    namespace = {}  # type: Dict[str, Any]
+    exec("def rate(current, opponent):\n    return {0}\n".format(terms), namespace)  # pylint: disable=exec-used
+    return namespace['rate']
 
-    def __init__(self, alpha_beta: Tuple[float, float]) -> None:
-        """
-        Initializes the _MiniMaxStrategy with the given alpha and beta values.
-        """
-        self._alpha, self._beta = alpha_beta
-        self._win_rating_value = 1 if self.is_maximizing else -1
-        self._optimal_rating = None  # type: Optional[_Rating]
 
-    @property
-    def alpha_beta(self) -> Tuple[float, float]:
-        """
-        Returns the current alpha and beta values for pruning.
-        """
-        return self._alpha, self._beta
-
-    @property
-    def optimal_rating(self) -> _Rating:
-        """
-        Returns the optimal rating found during the search.
-        """
-        assert self._optimal_rating is not None
-        return self._optimal_rating
-
-    @property
-    @abstractmethod
-    def is_maximizing(self) -> bool:
-        """
-        Abstract property that indicates whether the current strategy is maximizing or minimizing.
-        This property should be implemented by subclasses to return True if the strategy is 
-        maximizing, and False if the strategy is minimizing.
-
-        Returns:
-        True if the strategy is maximizing, False if it is minimizing.
-        """
-
-    def sort_nodes(self, nodes: List) -> None:
-        """
-        Sorts the given list of nodes based on their evaluation scores. The nodes are sorted 
-        in descending order if the current strategy is maximizing, and in ascending order if 
-        the strategy is minimizing. This pre-sorting helps improve the efficiency of the 
-        Alpha-Beta pruning algorithm by increasing the likelihood of pruning suboptimal branches early.
-        """
-        ratings = {node: self.evaluate(node) for node in nodes}
-        nodes.sort(key=lambda n: ratings[n], reverse=self.is_maximizing)
-
-    def evaluate(self, node: _Node) -> float:
-        """
-        Evaluates the given node in the game tree and returns a rating value based on the current game state.
-        """
-        if node.game_over_condition is not None:
-            if node.game_over_condition.winner is not None:
-                return self._win_rating_value
-            return 0.  # game ends in a draw
-
-        opponent_placements, current_player_placements = analyze_colour_placements(node.target_game_state)
-        winning_line_length = node.target_game_state.winning_line_length
-        rating_value = 0.
-
-        for i in range(winning_line_length, 1, -1):
-            rating_value += (current_player_placements[i] - opponent_placements[i]) * \
-                self._pow10(-(winning_line_length - i + 1)) * self._win_rating_value
+def _evaluate(game_state: ShiftagoExpress, game_status: int) -> float:
+    """
+    Evaluates the given game state with the given status and returns a rating value from the perspective
+    of the player who has made the move leading to it.
+    """
+    if game_status != GAME_ONGOING:
+        if game_status == GAME_WON:
+            return 1.  # only the player who has made the move can have won by it
+        return 0.  # game ends in a draw
 
-        return rating_value
+    opponent_placements, current_player_placements = analyze_colour_placements(game_state)
+    return _rating_function(game_state.winning_line_length)(current_player_placements, opponent_placements)
 
-    @staticmethod
-    @lru_cache(maxsize=10)
-    def _pow10(exp: int) -> float:
-        return math.pow(10, exp)
 
-    def can_prune(self) -> bool:
-        """
-        Determines whether the current branch of the game tree can be pruned based on the 
-        alpha and beta values. Pruning occurs when the alpha value is greater than or equal 
-        to the beta value, indicating that further exploration of this branch will not yield 
-        a better result.
+def _order_nodes(nodes: List[_Node], first_move: Optional[Move], killers: List[Move]) -> Iterator[_Node]:
+    """
+    Yields the given nodes in the order in which they should be searched: the node of the given first move,
+    then the nodes of the killer moves and then the remaining nodes in descending order of their evaluation
+    scores (nodes with equal priority in the order given). This pre-sorting helps improve the efficiency
+    of the Alpha-Beta pruning algorithm by increasing the likelihood of pruning suboptimal branches early.
+    As the search is often cut off after the first few nodes, they are taken lazily from a heap.
+    """
+    heap = [(0 if node.move == first_move else 1 if node.move in killers else 2, -node.rating, index, node)
+            for index, node in enumerate(nodes)]  # the unique index prevents comparing the nodes
+    heapq.heapify(heap)
+    while heap:
+        yield heapq.heappop(heap)[3]
 
-        Returns:
-        True if the branch can be pruned, False otherwise.
-        """
-        return self._alpha >= self._beta
 
-    @abstractmethod
-    def check_optimal(self, rating: _Rating) -> bool:
-        """
-        Abstract method to check if the given rating is optimal based on the current strategy 
-        (maximizing or minimizing). This method should be implemented by subclasses to update 
-        the optimal rating and determine if the current rating is better than the previously 
-        found optimal rating.
+_EXACT, _LOWER_BOUND, _UPPER_BOUND = range(3)  # kinds of ratings stored in the transposition table
 
-        Parameters:
-        rating: The rating to be checked.
 
-        Returns:
-        True if the rating is optimal, False otherwise.
-        """
+def _is_better(rating: _Rating, optimal_rating: _Rating) -> bool:
+    """
+    Checks if the given rating is better than the optimal rating found so far. If both ratings
+    have the same value, a winning line of play is better the earlier it ends and any other
+    line of play is better the later it ends.
+    """
+    if rating.value != optimal_rating.value:
+        return rating.value > optimal_rating.value
+    return rating.depth < optimal_rating.depth if rating.value > 0. else \
+        rating.depth > optimal_rating.depth
 
 
 class AlphaBetaPruning(AIEngine[ShiftagoExpress]):
@@ -203,88 +163,51 @@ class AlphaBetaPruning(AIEngine[ShiftagoExpress]):
     AlphaBetaPruning is an implementation of the Alpha-Beta pruning algorithm, 
     which is an optimization technique for the minimax algorithm. It reduces 
     the number of nodes evaluated in the search tree by eliminating branches 
-    that cannot possibly influence the final decision. This class contains 
-    nested classes and methods to handle the maximizing and minimizing strategies 
-    during the search process.
+    that cannot possibly influence the final decision. The search is implemented 
+    in its negamax form: every node is rated from the perspective of the player 
+    to move, so maximizing and minimizing levels are handled by the same code.
+
+    Attributes:
+    MIN_PARALLEL_DEPTH (int): The minimum search depth for which the subtrees of the root nodes 
+                              are searched in parallel if more than one worker process is allowed.
+    LATE_MOVE_INDEX (int): The index of the first pre-sorted move whose subtree is searched with a reduced
+                           depth first (late move reduction).
+    MAX_CACHE_SIZE (int): The number of entries of the transposition table or a cache above which
+                          it is cleared before the next move is selected.
     """
 
-    class _Maximizer(_MiniMaxStrategy):
-        """
-        _Maximizer is a concrete implementation of the _MiniMaxStrategy abstract base class 
-        for the maximizing strategy in the Alpha-Beta pruning algorithm. This strategy aims 
-        to maximize the evaluation score, representing the AI's best move.
-        """
+    MIN_PARALLEL_DEPTH = 4
+    LATE_MOVE_INDEX = 3
+    MAX_CACHE_SIZE = 200_000
 
-        @property
-        def is_maximizing(self) -> bool:
-            """
-            Indicates that this strategy is maximizing.
-
-            Returns:
-            True, as this strategy is maximizing.
-            """
-            return True
-
-        def check_optimal(self, rating: _Rating) -> bool:
-            """
-            Checks if the given rating is optimal based on the maximizing strategy. Updates 
-            the optimal rating if the current rating is better than the previously found 
-            optimal rating.
-
-            Returns:
-            True if the rating is optimal, False otherwise.
-            """
-            if self._optimal_rating is None or rating.value > self._optimal_rating.value:
-                self._optimal_rating = rating
-                self._alpha = max(self._alpha, self._optimal_rating.value)
-                return True
-            if rating.value == self._optimal_rating.value:
-                if rating.depth < self._optimal_rating.depth if rating.value > 0. else \
-                        rating.depth > self._optimal_rating.depth:
-                    self._optimal_rating = rating
-                    return True
-            return False
-
-    class _Minimizer(_MiniMaxStrategy):
+    def __init__(self, skill_level=SkillLevel.ADVANCED, max_workers: int = 1) -> None:
         """
-        _Minimizer is a concrete implementation of the _MiniMaxStrategy abstract base class 
-        for the minimizing strategy in the Alpha-Beta pruning algorithm. This strategy aims 
-        to minimize the evaluation score, representing the opponent's best move.
+        Initializes the AlphaBetaPruning with the given skill level and the maximum number
+        of worker processes searching the game tree in parallel.
         """
-
-        @property
-        def is_maximizing(self) -> bool:
-            """
-            Indicates that this strategy is minimizing.
-
-            Returns:
-            False, as this strategy is minimizing.
-            """
-            return False
-
-        def check_optimal(self, rating: _Rating) -> bool:
-            """
-            Checks if the given rating is optimal based on the minimizing strategy. Updates 
-            the optimal rating if the current rating is better than the previously found 
-            optimal rating.
-
-            Returns:
-            True if the rating is optimal, False otherwise.
-            """
-            if self._optimal_rating is None or rating.value < self._optimal_rating.value:
-                self._optimal_rating = rating
-                self._beta = min(self._beta, self._optimal_rating.value)
-                return True
-            if rating.value == self._optimal_rating.value:
-                if rating.depth < self._optimal_rating.depth if rating.value < 0. else \
-                        rating.depth > self._optimal_rating.depth:
-                    self._optimal_rating = rating
-                    return True
-            return False
-
-    def __init__(self, skill_level=SkillLevel.ADVANCED) -> None:
         super().__init__(skill_level)
         self._max_depth = 2 + skill_level.value
+        self._max_workers = max_workers
+        self._process_pool = None  # type: Optional[ProcessPoolExecutor]
+        # Zobrist key -> (searched depth, rating value, relative rating depth, kind of rating, optimal move)
+        self._transpositions = {}  # type: Dict[int, Tuple[int, float, int, int, Move]]
+        # caches of the possible moves and the static ratings of the game states by their Zobrist keys
+        # (like the transposition table, they are kept from one move to the next)
+        self._possible_moves = {}  # type: Dict[int, List[Move]]
+        self._ratings = {}  # type: Dict[int, float]
+        # Nodes no longer needed are kept for reuse. As the nodes of a depth are released before the search
+        # returns to the depth above, there are never more of them than the nodes of one branch of the tree.
+        self._node_pool = []  # type: List[_Node]
+        # the two most recent moves per depth that have caused a cut-off ("killer moves")
+        self._killers = [[None, None] for _ in range(self._max_depth + 1)]  # type: List[List[Optional[Move]]]
+
+    def shutdown(self) -> None:
+        """
+        Shuts down the worker processes, if any have been started.
+        """
+        if self._process_pool is not None:
+            self._process_pool.shutdown()
+            self._process_pool = None
 
     def select_move(self, game_state: ShiftagoExpress) -> Move:
         """
@@ -293,45 +216,270 @@ class AlphaBetaPruning(AIEngine[ShiftagoExpress]):
         """
         # Ensure the game involves exactly two players
         assert len(game_state.colours) == 2
+        # The search applies and reverts the moves on a copy, so the given game state remains untouched.
+        game_state = copy.copy(game_state)
 
         # If more than one slot is occupied, use the Alpha-Beta pruning algorithm to select the move
         if game_state.count_occupied_slots() > 1:
-            move, rating = self._apply(game_state, 1, (-math.inf, math.inf))
-            _logger.debug("Selected move: %s (%s)", move, rating)
+            # A move winning immediately needs no search.
+            for move in game_state.detect_all_possible_moves():
+                game_status = game_state.make_move(move)
+                game_state.undo_move()
+                if game_status == GAME_WON:
+                    _logger.debug("Selected winning move: %s", move)
+                    return move
+            # Iterative deepening: the optimal move of each iteration is searched first by the next one.
+            self._limit_caches()
+            self._node_pool.clear()
+            self._killers = [[None, None] for _ in range(self._max_depth + 1)]
+            move = None  # type: Optional[Move]
+            for max_depth in range(1, self._max_depth + 1):
+                move, rating = self._apply(game_state, 1, (-math.inf, math.inf), max_depth, move)
+                _logger.debug("Optimal move at depth %d: %s (%s)", max_depth, move, rating)
+                if rating.value == 1.:
+                    break  # a forced win has been found, searching deeper cannot find an earlier one
+            assert move is not None
+            _logger.debug("Selected move: %s", move)
             return move
 
         # If only one slot is occupied, select a random move from all possible moves
-        move = random.choice(game_state.detect_all_possible_moves())
+        move = game_state.sample_possible_move()
         _logger.debug("Selected random move: %s", move)
         return move
 
-    def _apply(self, game_state: ShiftagoExpress, depth: int, alpha_beta: Tuple[float, float]) \
-            -> Tuple[Move, _Rating]:
+    def _limit_caches(self) -> None:
+        """
+        Clears the transposition table and the caches that have grown too large. Otherwise they are kept
+        for the following searches, as their game trees overlap with the previous ones.
+        """
+        for cache in (self._transpositions, self._possible_moves, self._ratings):
+            if len(cache) > self.MAX_CACHE_SIZE:
+                cache.clear()
+
+    def _apply(self, game_state: ShiftagoExpress, depth: int, alpha_beta: Tuple[float, float],
+               max_depth: int, first_move: Optional[Move] = None) -> Tuple[Move, _Rating]:
         """
         Recursively applies the Alpha-Beta pruning algorithm to evaluate and select the optimal move.
+        Alpha, beta and the returned rating refer to the player to move in the given game state;
+        the rating of a child node is therefore negated and its alpha-beta window swapped.
+        Game states that have been searched before, e.g. after transposed moves, are looked up
+        in the transposition table.
 
         Parameters:
         game_state: The current state of the game.
         depth: The current depth in the game tree.
         alpha_beta: The current alpha and beta values for pruning.
+        max_depth: The depth at which the search stops.
+        first_move: An optional move to be searched before all others.
 
         Returns:
         The optimal move and its corresponding rating.
         """
-        strategy = self._Maximizer(alpha_beta) if depth % 2 == 1 else self._Minimizer(alpha_beta)
-        nodes = [_Node(game_state, move) for move in game_state.detect_all_possible_moves()]
-        if depth < self._max_depth:
-            # Pre-sorting massively increases the efficiency of pruning!
-            strategy.sort_nodes(nodes)
+        alpha, beta = alpha_beta
+        searched_depth = max_depth - depth
+        key = game_state.zobrist_key
+        transposition = self._transpositions.get(key)
+        if transposition is not None:
+            stored_depth, value, relative_depth, kind, move = transposition
+            if stored_depth >= searched_depth:
+                if kind == _LOWER_BOUND:
+                    alpha = max(alpha, value)
+                elif kind == _UPPER_BOUND:
+                    beta = min(beta, value)
+                if kind == _EXACT or alpha >= beta:
+                    return move, _Rating(value, depth + relative_depth)
+            if first_move is None:
+                first_move = move
+        possible_moves = self._possible_moves.get(key)
+        if possible_moves is None:
+            possible_moves = game_state.detect_all_possible_moves()
+            self._possible_moves[key] = possible_moves
+        # The optimal rating is kept in plain locals, a _Rating is only created for the result.
         optimal_move = None
+        optimal_value, optimal_depth = -math.inf, depth
+        killers = self._killers[depth]
+        if depth == max_depth:
+            # Most of the game tree is at the horizon, where moves are just rated statically:
+            # this is done in a loop of its own that doesn't create any nodes.
+            # stable, so only the killer moves are moved
+            for move in sorted(possible_moves, key=lambda m: m not in killers):
+                game_status, value = self._rate_move(game_state, move)
+                if optimal_move is None or value > optimal_value:  # all ratings have the same depth
+                    optimal_move, optimal_value = move, value
+                    if value > alpha:
+                        alpha = value
+                        if alpha >= beta:
+                            if game_status == GAME_ONGOING:
+                                self._add_killer(killers, move)
+                            break
+        else:
+            # Pre-sorting massively increases the efficiency of pruning!
+            nodes = [self._acquire_node(game_state, move) for move in possible_moves]
+            if depth == 1 and self._max_workers > 1 and max_depth >= self.MIN_PARALLEL_DEPTH:
+                return self._apply_in_parallel(game_state, list(_order_nodes(nodes, first_move, killers)),
+                                               (alpha, beta), max_depth)
+            for move_index, each_node in enumerate(_order_nodes(nodes, first_move, killers)):
+                if each_node.is_leaf:
+                    value, rating_depth = each_node.rating, depth
+                else:
+                    game_state.make_move(each_node.move)
+                    if move_index >= self.LATE_MOVE_INDEX and depth < max_depth - 1:
+                        # Late move reduction: a move sorted that far back is unlikely to be the optimal one, so
+                        # a shallower search is done first and repeated at full depth only if it reaches alpha.
+                        _, child_rating = self._apply(game_state, depth + 1, (-beta, -alpha), max_depth - 1)
+                        if -child_rating.value < alpha:
+                            game_state.undo_move()
+                            continue
+                    _, child_rating = self._apply(game_state, depth + 1, (-beta, -alpha), max_depth)
+                    game_state.undo_move()
+                    value, rating_depth = -child_rating.value, child_rating.depth
+                # same as _is_better, inlined
+                if optimal_move is None or value > optimal_value or \
+                        (value == optimal_value and (rating_depth < optimal_depth if value > 0. else
+                                                     rating_depth > optimal_depth)):
+                    optimal_move = each_node.move
+                    optimal_value, optimal_depth = value, rating_depth
+                    if value > alpha:
+                        alpha = value
+                        if alpha >= beta:
+                            if not each_node.is_leaf:
+                                self._add_killer(killers, each_node.move)
+                            break
+            self._node_pool.extend(nodes)
+        assert optimal_move is not None
+        if optimal_value <= alpha_beta[0]:
+            kind = _UPPER_BOUND
+        elif optimal_value >= alpha_beta[1]:
+            kind = _LOWER_BOUND
+        else:
+            kind = _EXACT
+        self._transpositions[key] = (searched_depth, optimal_value, optimal_depth - depth, kind, optimal_move)
+        return optimal_move, _Rating(optimal_value, optimal_depth)
+
+    def _rate_move(self, game_state: ShiftagoExpress, move: Move) -> Tuple[int, float]:
+        """
+        Applies the given move to the given game state, rates the resulting game state statically and
+        reverts the move. The ratings of game states whose game is still ongoing are cached.
+
+        Returns:
+        The status of the game after the move and the rating of the resulting game state from the
+        perspective of the player who has made the move.
+        """
+        game_status = game_state.make_move(move)
+        if game_status == GAME_ONGOING:
+            key = game_state.zobrist_key
+            rating = self._ratings.get(key)
+            if rating is None:
+                rating = _evaluate(game_state, game_status)
+                self._ratings[key] = rating
+        else:
+            rating = _evaluate(game_state, game_status)
+        game_state.undo_move()
+        return game_status, rating
+
+    def _acquire_node(self, game_state: ShiftagoExpress, move: Move) -> _Node:
+        """
+        Returns a node for the given move applied to the given game state, reusing a released node if possible.
+        """
+        game_status, rating = self._rate_move(game_state, move)
+        if self._node_pool:
+            node = self._node_pool.pop()
+            node.reset(move, game_status, rating)
+            return node
+        return _Node(move, game_status, rating)
+
+    @staticmethod
+    def _add_killer(killers: List[Optional[Move]], move: Move) -> None:
+        """
+        Records the given move, which has caused a cut-off, as the most recent killer move of its depth.
+        Killer moves are searched early by the sibling nodes, where they are likely to cause a cut-off again.
+        """
+        if killers[0] != move:
+            killers[1] = killers[0]
+            killers[0] = move
+
+    def _apply_in_parallel(self, game_state: ShiftagoExpress, nodes: List[_Node], alpha_beta: Tuple[float, float],
+                           max_depth: int) -> Tuple[Move, _Rating]:
+        """
+        Applies the Alpha-Beta pruning algorithm to the root nodes of the game tree, whose subtrees are
+        searched by a pool of worker processes. The first node is searched synchronously to establish
+        the alpha-beta window for its siblings ("young brothers wait"). Like a synchronous search,
+        it stores the resulting entry of the root in the transposition table.
+
+        Parameters:
+        game_state: The game state of the root.
+        nodes: The pre-sorted root nodes.
+        alpha_beta: The alpha and beta values for pruning.
+        max_depth: The depth at which the search stops.
+
+        Returns:
+        The optimal move and its corresponding rating.
+        """
+        alpha, beta = alpha_beta
+        ratings = []  # type: List[_Rating | Future[_Rating]]
+        synchronously_searched = False
         for each_node in nodes:
-            if each_node.is_leaf or depth == self._max_depth:
-                current_rating = _Rating(strategy.evaluate(each_node), depth)
+            if each_node.is_leaf:
+                rating = _Rating(each_node.rating, 1)
+            elif not synchronously_searched:
+                game_state.make_move(each_node.move)
+                _, child_rating = self._apply(game_state, 2, (-beta, -alpha), max_depth)
+                game_state.undo_move()
+                rating = _Rating(-child_rating.value, child_rating.depth)
+                synchronously_searched = True
             else:
-                _, current_rating = self._apply(each_node.target_game_state, depth + 1, strategy.alpha_beta)
-            if strategy.check_optimal(current_rating):
-                optimal_move = each_node.move
-                if strategy.can_prune():
-                    break
-        assert optimal_move is not None
-        return optimal_move, strategy.optimal_rating
+                if self._process_pool is None:
+                    self._process_pool = ProcessPoolExecutor(self._max_workers,
+                                                             mp_context=multiprocessing.get_context('spawn'))
+                target_game_state = copy.copy(game_state)
+                target_game_state.make_move(each_node.move)
+                ratings.append(self._process_pool.submit(self._search_subtree, self.skill_level,
+                                                         target_game_state, (-beta, -alpha), max_depth))
+                continue
+            ratings.append(rating)
+            alpha = max(alpha, rating.value)
+            if alpha >= beta:
+                break
+        optimal_move, optimal_rating = None, None  # type: Optional[Move], Optional[_Rating]
+        # merge the ratings in the order of the nodes to keep the selection deterministic
+        for each_node, rating_or_future in zip(nodes, ratings):
+            if isinstance(rating_or_future, Future):
+                child_rating = rating_or_future.result()
+                rating = _Rating(-child_rating.value, child_rating.depth)
+            else:
+                rating = rating_or_future
+            if optimal_rating is None or _is_better(rating, optimal_rating):
+                optimal_move, optimal_rating = each_node.move, rating
+        assert optimal_move is not None and optimal_rating is not None
+        if optimal_rating.value <= alpha_beta[0]:
+            kind = _UPPER_BOUND
+        elif optimal_rating.value >= alpha_beta[1]:
+            kind = _LOWER_BOUND
+        else:
+            kind = _EXACT
+        self._transpositions[game_state.zobrist_key] = (max_depth - 1, optimal_rating.value,
+                                                        optimal_rating.depth - 1, kind, optimal_move)
+        return optimal_move, optimal_rating
+
+    @staticmethod
+    def _search_subtree(skill_level: SkillLevel, game_state: ShiftagoExpress, alpha_beta: Tuple[float, float],
+                        max_depth: int) -> _Rating:
+        """
+        Searches the subtree of a root node. This method is executed by a worker process, whose engine
+        keeps its transposition table and caches for all the subtrees it searches.
+
+        Returns:
+        The rating of the game state from the perspective of the player to move in it.
+        """
+        engine = _subtree_engine(skill_level)
+        engine._limit_caches()  # pylint: disable=protected-access
+        _, rating = engine._apply(game_state, 2, alpha_beta, max_depth)  # pylint: disable=protected-access
+        return rating
+
+
+@lru_cache(maxsize=None)
+def _subtree_engine(skill_level: SkillLevel) -> AlphaBetaPruning:
+    """
+    Returns the AI engine of a worker process, which searches all the subtrees dispatched to this process.
+    """
+    return AlphaBetaPruning(skill_level)
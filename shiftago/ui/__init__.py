@@ -1,21 +1,27 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional, Callable, TypeAlias, cast
-from importlib.resources import path as resrc_path
-from PySide6.QtCore import QObject, Signal, SignalInstance
-from PySide6.QtGui import QPixmap
+from functools import lru_cache
+from typing import List, Optional, Callable, TypeAlias, TYPE_CHECKING
+from importlib.resources import files, as_file
 import shiftago.ui.images
 
+# Qt is imported only when it is actually used, so that the events can be used without it.
+if TYPE_CHECKING:
+    from PySide6.QtGui import QPixmap
 
-def load_image(image_resource: str) -> QPixmap:
+
+@lru_cache(maxsize=None)
+def load_image(image_resource: str) -> 'QPixmap':
     """
-    Loads an image resource and returns it as a QPixmap object.
+    Loads an image resource and returns it as a QPixmap object. As QPixmap objects are implicitly shared,
+    each image resource is decoded only once and the same QPixmap is returned for repeated calls.
     """
-    with resrc_path(shiftago.ui.images, image_resource) as path:
+    from PySide6.QtGui import QPixmap  # pylint: disable=import-outside-toplevel
+    with as_file(files(shiftago.ui.images).joinpath(image_resource)) as path:
         return QPixmap(str(path))
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppEvent:
     """
     AppEvent is a base class for application events. It is used to represent events that occur within the application.
@@ -29,30 +35,25 @@ AppEventHandler: TypeAlias = Callable[[AppEvent], None]
 class AppEventEmitter:
     """
     AppEventEmitter is responsible for emitting application events to connected handlers.
-    It uses Qt's signal-slot mechanism to manage event handling.
+    The handlers are simply called by the emitting thread.
     """
 
-    class _QObject(QObject):
-        """
-        _QObject is used internally as delegate to emit event signals.
-        """
-        event_signal = Signal(AppEvent)
-
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
-        self._qobject = self._QObject()
+        self._app_event_handlers: List[AppEventHandler] = []
 
     def connect_with(self, handler: AppEventHandler):
         """
         Connects the given handler to the event emitter.
         """
-        cast(SignalInstance, self._qobject.event_signal).connect(handler)
+        self._app_event_handlers.append(handler)
 
     def emit(self, event: AppEvent) -> None:
         """
         Emits the given event to all connected handlers.
         """
-        cast(SignalInstance, self._qobject.event_signal).emit(event)
+        for handler in self._app_event_handlers:
+            handler(event)
 
 
 class Controller(ABC):
@@ -65,6 +66,9 @@ class Controller(ABC):
         """
         Initializes the Controller with an optional parent controller and view.
         """
+        # Binding a singledispatchmethod creates a new dispatching function on every access,
+        # so the handler is bound only once.
+        self._bound_handle_event = self.handle_event
         self._app_event_emitter: Optional[AppEventEmitter] = None
         if parent is not None:
             self._app_event_emitter = AppEventEmitter()
@@ -73,17 +77,23 @@ class Controller(ABC):
 
     def connect_with(self, event_emitter: AppEventEmitter):
         """
-        Connects the controller with the given event emitter. This method sets up an event handler
-        that processes events and delegates them to the parent controller if necessary.
+        Connects the controller with the given event emitter, so that its events are processed
+        by this controller and delegated to the parent controller if necessary.
+
+        Parameters:
+        event_emitter: The event emitter to be connected.
+        """
+        event_emitter.connect_with(self._dispatch_event)
+
+    def _dispatch_event(self, event: AppEvent) -> None:
+        """
+        Lets this controller handle the given event and delegates it to the parent controller if it isn't handled.
         """
-        def handle_event(event: AppEvent) -> None:
-            if not self.handle_event(event):
-                if self._app_event_emitter is not None:
-                    self._app_event_emitter.emit(event)  # delegate handling to parent
-                else:
-                    raise ValueError(f"Unexpected event: {event}")
-
-        event_emitter.connect_with(handle_event)
+        if not self._bound_handle_event(event):
+            if self._app_event_emitter is not None:
+                self._app_event_emitter.emit(event)  # delegate handling to parent
+            else:
+                raise ValueError(f"Unexpected event: {event}")
 
     @abstractmethod
     def handle_event(self, event: AppEvent) -> bool:
@@ -3,56 +3,78 @@ from shiftago.core import Side, Slot, Colour, Move
 from shiftago.ui import AppEvent
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ReadyForFirstMoveEvent(AppEvent):
     """Emitted by view."""
 
 
-@dataclass(frozen=True)
+# Events without payload are all alike, so a single instance of each of them is emitted.
+READY_FOR_FIRST_MOVE = ReadyForFirstMoveEvent()
+
+
+@dataclass(frozen=True, slots=True)
 class MoveSelectedEvent(AppEvent):
     """Emitted by view and thinking worker."""
     move: Move
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AnimationFinishedEvent(AppEvent):
     """Emitted by view."""
 
 
-@dataclass(frozen=True)
+ANIMATION_FINISHED = AnimationFinishedEvent()
+
+
+@dataclass(frozen=True, slots=True)
 class NewGameRequestedEvent(AppEvent):
     """Emitted by view when a new game is requested."""
 
 
-@dataclass(frozen=True)
+NEW_GAME_REQUESTED = NewGameRequestedEvent()
+
+
+@dataclass(frozen=True, slots=True)
 class ScreenshotRequestedEvent(AppEvent):
     """Emitted by view when a screenshot is requested."""
 
 
-@dataclass(frozen=True)
+SCREENSHOT_REQUESTED = ScreenshotRequestedEvent()
+
+
+@dataclass(frozen=True, slots=True)
 class AppInfoRequestedEvent(AppEvent):
     """Emitted by view when 'About' is selected."""
 
 
-@dataclass(frozen=True)
+APP_INFO_REQUESTED = AppInfoRequestedEvent()
+
+
+@dataclass(frozen=True, slots=True)
 class ExitRequestedEvent(AppEvent):
     """Emitted by view when exiting is requested."""
 
 
-@dataclass(frozen=True)
+EXIT_REQUESTED = ExitRequestedEvent()
+
+
+@dataclass(frozen=True, slots=True)
 class MarbleShiftedEvent(AppEvent):
     """Emitted by model when a marble is shifted."""
     slot: Slot
     direction: Side
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarbleInsertedEvent(AppEvent):
     """Emitted by model when a marble is inserted."""
     slot: Slot
     colour: Colour
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BoardResetEvent(AppEvent):
     """Emitted by model when the board is reset."""
+
+
+BOARD_RESET = BoardResetEvent()
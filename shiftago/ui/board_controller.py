@@ -1,9 +1,10 @@
 import time
 import logging
 from functools import singledispatchmethod
-from PySide6.QtCore import QObject, QThread
+from PySide6.QtCore import Qt, QObject, QThread, QTimer, QCoreApplication, Signal
 from statemachine import StateMachine, State
-from shiftago.ui import Controller, AppEvent, AppEventEmitter
+from shiftago.core import Move
+from shiftago.ui import Controller, AppEvent
 from .board_view import BoardView
 from .game_model import ShiftagoExpressModel, PlayerNature
 from .app_events import ReadyForFirstMoveEvent, MoveSelectedEvent, AnimationFinishedEvent
@@ -17,7 +18,66 @@ class BoardController(Controller):
     It handles user input, updates the game state, and triggers animations and events based on the game logic.
     """
 
-    class _BoardStateMachine(AppEventEmitter, StateMachine):
+    class ComputerThinkingWorker(QObject):
+        """
+        ComputerThinkingWorker is responsible for handling the AI's thinking process in a separate thread.
+        It performs the AI's move calculation and signals the selected move together with the generation
+        of the game it was requested for, so that moves of a game that has been reset meanwhile can be dropped.
+        The thread is started once and kept running until the application is about to quit.
+
+        Attributes:
+        DELAY (float): The delay in seconds before the AI makes a move.
+        """
+
+        DELAY = 1.
+
+        move_selected = Signal(int, object)  # generation of the game, selected move
+
+        _thinking_requested = Signal(int)
+
+        def __init__(self, model: ShiftagoExpressModel) -> None:
+            """
+            Initializes the ComputerThinkingWorker with the given model.
+            """
+            super().__init__()
+            self._model = model
+            self._thread = QThread()
+            self._thread.setObjectName('ThinkingThread')
+            self.moveToThread(self._thread)
+            self._thinking_requested.connect(self._think)  # queued, as this worker lives in its thread
+            self._thread.start()
+
+        def start_thinking(self, generation: int) -> None:
+            """
+            Lets the worker thread perform the AI's move calculation.
+
+            Parameters:
+            generation: The generation of the game the move is calculated for.
+            """
+            self._thinking_requested.emit(generation)
+
+        def stop(self) -> None:
+            """
+            Stops the worker thread and waits until it has finished.
+            """
+            self._thread.quit()
+            self._thread.wait()
+
+        def _think(self, generation: int) -> None:
+            """
+            Performs the AI's move calculation and signals the selected move, but not before the delay
+            has passed. Instead of sleeping, the signal is emitted by a timer of the thread's event loop.
+            """
+            _logger.debug("Computer is thinking...")
+            start_time: float = time.perf_counter()
+            move = self._model.ai_select_move()
+            if move is None:
+                return  # the application is about to quit
+            duration: float = time.perf_counter() - start_time
+            QTimer.singleShot(int(max(0., self.DELAY - duration) * 1000),
+                              lambda: self.move_selected.emit(generation, move))
+
+    class _BoardStateMachine(StateMachine):
         """
         _BoardStateMachine is a state machine that manages the different states of the game board.
         It handles transitions between states such as player notification, computer thinking, human thinking,
@@ -40,64 +100,24 @@ class BoardController(Controller):
             performing_animation_state.to(human_thinking_state)
         to_end_of_game = performing_animation_state.to(game_over_state)
 
-        class ComputerThinkingWorker(QObject):
-            """
-            ComputerThinkingWorker is responsible for handling the AI's thinking process in a separate thread.
-            It performs the AI's move calculation and emits events when the AI has selected a move.
-
-            Attributes:
-            DELAY (float): The delay in seconds before the AI makes a move.
-            """
-
-            DELAY = 1.
-
-            def __init__(self, model: ShiftagoExpressModel,
-                         app_event_emitter: AppEventEmitter) -> None:
-                """
-                Initializes the ComputerThinkingWorker with the given model and event emitter.
-                """
-                super().__init__()
-                self._model = model
-                self._app_event_emitter = app_event_emitter
-                self._thread = QThread()
-                self._thread.setObjectName('ThinkingThread')
-                self.moveToThread(self._thread)
-                self._thread.started.connect(self._think)
-
-            def _think(self) -> None:
-                """
-                Performs the AI's move calculation and emits an event when the move is selected.
-                """
-                _logger.debug("Computer is thinking...")
-                start_time: float = time.time()
-                move = self._model.ai_select_move()
-                duration: float = time.time() - start_time
-                if duration < self.DELAY:
-                    time.sleep(self.DELAY - duration)
-                self._app_event_emitter.emit(MoveSelectedEvent(move))
-
-        def __init__(self, model: ShiftagoExpressModel, view: BoardView) -> None:
+        def __init__(self, model: ShiftagoExpressModel, view: BoardView,
+                     computer_thinking_worker: 'BoardController.ComputerThinkingWorker', generation: int) -> None:
             """
-            Initializes the _BoardStateMachine with the given model and view.
+            Initializes the _BoardStateMachine with the given model and view. The given computer thinking worker
+            calculates the AI's moves of the given generation of the game.
             """
             super().__init__()
             self._model = model
             self._view = view
-            self._computer_thinking_worker = self.ComputerThinkingWorker(model, self)
+            self._computer_thinking_worker = computer_thinking_worker
+            self._generation = generation
 
         @computer_thinking_state.enter
         def enter_computer_thinking(self) -> None:
             """
-            On entering the computer thinking state the computer thinking worker thread is started.
-            """
-            self._computer_thinking_worker.thread().start()
-
-        @computer_thinking_state.exit
-        def exit_computer_thinking(self) -> None:
-            """
-            On exiting the computer thinking state the computer thinking worker thread is stopped.
+            On entering the computer thinking state the computer thinking worker starts thinking.
             """
-            self._computer_thinking_worker.thread().quit()
+            self._computer_thinking_worker.start_thinking(self._generation)
 
         @human_thinking_state.enter
         def enter_human_thinking(self) -> None:
@@ -135,22 +155,48 @@ class BoardController(Controller):
         super().__init__(parent, view)
         self._model = model
         self._view = view
+        # incremented on reset, so that a move the AI is still calculating for the previous game is dropped
+        self._generation = 0
+        self._computer_thinking_worker = self.ComputerThinkingWorker(model)
+        # the worker signals its moves in a thread of its own
+        self._computer_thinking_worker.move_selected.connect(self._computer_move_selected,
+                                                             Qt.ConnectionType.QueuedConnection)
+        QCoreApplication.instance().aboutToQuit.connect(self._shut_down)
         self._init_state_machine()
 
     def _init_state_machine(self) -> None:
         """
         Initializes the state machine for the game board.
         """
-        self._state_machine = self._BoardStateMachine(self._model, self._view)
-        self.connect_with(self._state_machine)
+        self._state_machine = self._BoardStateMachine(self._model, self._view,
+                                                      self._computer_thinking_worker, self._generation)
 
     def reset(self) -> None:
         """
-        Resets the game model and reinitializes the state machine.
+        Resets the game model and reinitializes the state machine. A move the AI is still calculating
+        isn't waited for; it is dropped when it arrives.
         """
+        self._generation += 1
         self._model.reset()
         self._init_state_machine()
 
+    def _shut_down(self) -> None:
+        """
+        Shuts down the AI of the model and then stops the thread of the computer thinking worker,
+        which doesn't have to wait for a search in progress, as it fails on shutdown.
+        """
+        self._model.shutdown()
+        self._computer_thinking_worker.stop()
+
+    def _computer_move_selected(self, generation: int, move: Move) -> None:
+        """
+        Handles the move selected by the computer thinking worker unless it was calculated for a previous game.
+        """
+        if generation != self._generation:
+            _logger.debug("Dropping move %s of a previous game.", move)
+        else:
+            self._dispatch_event(MoveSelectedEvent(move))
+
     @property
     def model(self) -> ShiftagoExpressModel:
         """
@@ -191,10 +237,7 @@ class BoardController(Controller):
         _logger.info("Starting player is %s (%s).", current_player.colour.name,
                      'human' if current_player.nature is PlayerNature.HUMAN else 'computer')
         _logger.info("Skill level: %s", self._model.skill_level.name)
-        if current_player.nature is PlayerNature.HUMAN:
-            self._state_machine.to_human_player()  # type: ignore
-        else:
-            self._state_machine.to_artifial_player()  # type: ignore
+        self._to_player_whose_turn_it_is()
         return True
 
     @handle_event.register
@@ -221,10 +264,16 @@ class BoardController(Controller):
         assert self._state_machine.current_state == self._BoardStateMachine.performing_animation_state
         _logger.debug("Animation finished.")
         if self._model.game_over_condition is None:
-            if self._model.whose_turn_it_is.nature is PlayerNature.HUMAN:
-                self._state_machine.to_human_player()  # type: ignore
-            else:
-                self._state_machine.to_artifial_player()  # type: ignore
+            self._to_player_whose_turn_it_is()
         else:
             self._state_machine.to_end_of_game()  # type: ignore
         return True
+
+    def _to_player_whose_turn_it_is(self) -> None:
+        """
+        Transitions to the thinking state of the player whose turn it is.
+        """
+        if self._model.whose_turn_it_is.nature is PlayerNature.HUMAN:
+            self._state_machine.to_human_player()  # type: ignore
+        else:
+            self._state_machine.to_artifial_player()  # type: ignore
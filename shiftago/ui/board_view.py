@@ -1,14 +1,14 @@
 import logging
-from collections import defaultdict, deque
+from collections import deque
 from functools import singledispatchmethod
-from typing import Any, Optional, NamedTuple, Set, override
-from PySide6.QtCore import Qt, QSize, QPoint, QRectF, QByteArray, QPropertyAnimation
-from PySide6.QtWidgets import QWidget, QMessageBox, QGraphicsView, QGraphicsScene, QGraphicsObject, \
-    QStyleOptionGraphicsItem, QGraphicsEllipseItem
+from typing import Any, Callable, Iterable, Optional, Set, override
+from PySide6.QtCore import Qt, QSize, QPoint, QPointF, QRectF, QAbstractAnimation, QVariantAnimation, \
+    QParallelAnimationGroup
+from PySide6.QtWidgets import QMessageBox, QGraphicsView, QGraphicsScene, QGraphicsPixmapItem, QGraphicsEllipseItem
 from PySide6.QtGui import QPixmap, QPainter, QMouseEvent, QCursor, QPen
-from shiftago.core import Colour, Slot, Side, Move, SlotsInLine
+from shiftago.core import NUM_SLOTS_PER_SIDE, Colour, Slot, Side, Move, SlotsInLine
 from shiftago.ui import load_image, AppEvent, AppEventEmitter
-from .app_events import ReadyForFirstMoveEvent, AnimationFinishedEvent, MoveSelectedEvent, MarbleInsertedEvent, \
+from .app_events import READY_FOR_FIRST_MOVE, ANIMATION_FINISHED, MoveSelectedEvent, MarbleInsertedEvent, \
     MarbleShiftedEvent, BoardResetEvent
 from .game_model import BoardViewModel, PlayerNature
 
@@ -18,6 +18,39 @@ BOARD_VIEW_SIZE = QSize(700, 700)
 _logger = logging.getLogger(__name__)
 
 
+def _slot_positions(origin: QPoint, step: QSize) -> tuple[QPointF, ...]:
+    """
+    Computes the position of each slot on the game board, indexed by the slot.
+
+    Parameters:
+    origin: The position of the top left slot.
+    step: The horizontal and vertical distance between neighbouring slots.
+
+    Returns:
+    A tuple whose item at index slot is the position of that slot.
+    """
+    return tuple(QPointF(origin.x() + (index % NUM_SLOTS_PER_SIDE) * step.width(),
+                         origin.y() + (index // NUM_SLOTS_PER_SIDE) * step.height())
+                 for index in range(NUM_SLOTS_PER_SIDE * NUM_SLOTS_PER_SIDE))
+
+
+def _item_animation(setter: Callable[[Any], None], start_value: Any) -> QVariantAnimation:
+    """
+    Creates an animation of a property of a graphics item that is not a QObject.
+
+    Parameters:
+    setter: The setter of the animated property; it is called with every interpolated value.
+    start_value: The start value of the animation.
+
+    Returns:
+    The animation, whose end value and duration are still to be set.
+    """
+    animation = QVariantAnimation()
+    animation.setStartValue(start_value)
+    animation.valueChanged.connect(setter)
+    return animation
+
+
 class _AnimationManager:
     """
     _AnimationManager is responsible for managing animations in the game.
@@ -29,10 +62,10 @@ class _AnimationManager:
         Initializes the _AnimationManager with the given event emitter.
         """
         self._app_event_emitter = app_event_emitter
-        self._running_animation: Optional[QPropertyAnimation] = None
-        self._waiting_animations: deque[QPropertyAnimation] = deque()
+        self._running_animation: Optional[QAbstractAnimation] = None
+        self._waiting_animations: deque[QAbstractAnimation] = deque()
 
-    def perform(self, animation: QPropertyAnimation, end_value: Any, duration: int) -> None:
+    def perform(self, animation: QVariantAnimation, end_value: Any, duration: int) -> None:
         """
         Performs the given animation. If another animation is already running, the new animation is queued.
 
@@ -43,6 +76,28 @@ class _AnimationManager:
         """
         animation.setEndValue(end_value)
         animation.setDuration(duration)
+        self._enqueue(animation)
+
+    def perform_in_parallel(self, animations: Iterable[tuple[QVariantAnimation, Any]], duration: int) -> None:
+        """
+        Performs the given animations simultaneously as one step. If another animation is already running,
+        the step is queued.
+
+        Parameters:
+        animations: Pairs of an animation and its end value.
+        duration: The duration of the animations in milliseconds.
+        """
+        group = QParallelAnimationGroup()
+        for animation, end_value in animations:
+            animation.setEndValue(end_value)
+            animation.setDuration(duration)
+            group.addAnimation(animation)
+        self._enqueue(group)
+
+    def _enqueue(self, animation: QAbstractAnimation) -> None:
+        """
+        Starts the given configured animation or queues it if another animation is already running.
+        """
         animation.finished.connect(self._finished)
         if self._running_animation is not None:
             self._waiting_animations.append(animation)
@@ -59,32 +114,21 @@ class _AnimationManager:
     def _finished(self) -> None:
         """
         Handles the completion of the current animation and starts the next animation in the queue, if any.
+        The finished animation is disconnected before it is dropped; if it is a group, its child animations
+        are released along with it.
         """
+        assert self._running_animation is not None
+        self._running_animation.finished.disconnect(self._finished)
         if len(self._waiting_animations) > 0:
             self._running_animation = self._waiting_animations.popleft()
             self._running_animation.start()
         else:
             self._running_animation = None
-            self._app_event_emitter.emit(AnimationFinishedEvent())
+            self._app_event_emitter.emit(ANIMATION_FINISHED)
 
 
 class BoardView(AppEventEmitter, QGraphicsView):
 
-    class CursorPair(NamedTuple):
-        """
-        CursorPair is a named tuple that holds two QCursor objects: one for the enabled state
-        and one for the disabled state. It provides a method to retrieve the appropriate cursor
-        based on the enabled state.
-        """
-        enabled: QCursor
-        disabled: QCursor
-
-        def get(self, enabled: bool) -> QCursor:
-            """
-            Returns the appropriate cursor based on the enabled state.
-            """
-            return self.enabled if enabled else self.disabled
-
     class BoardScene(QGraphicsScene):
         """
         BoardScene is a custom QGraphicsScene that represents the game board.
@@ -96,74 +140,70 @@ class BoardView(AppEventEmitter, QGraphicsView):
         IMAGE_OFFSET_Y = (BOARD_VIEW_SIZE.height() - IMAGE_SIZE.height()) // 2
         SLOT_SIZE = QSize(59, 59)
 
-        class Marble(QGraphicsObject):
-            """
-            Marble is a custom QGraphicsObject that represents a marble on the game board.
-            """
+        MARBLE_SIZE = QSize(70, 70)
 
-            SIZE = QSize(70, 70)
-
-            def __init__(self, pixmap: QPixmap, position: QPoint) -> None:
-                """
-                Initializes the Marble with the given pixmap and position.
-                """
-                super().__init__()
-                self.setPos(position)
-                self._pixmap = pixmap
-
-            @override
-            def boundingRect(self) -> QRectF:  # pylint: disable=invalid-name
-                """
-                Returns the bounding rectangle of the marble.
-                """
-                return QRectF(0, 0, self.SIZE.width(), self.SIZE.height())
-
-            @override
-            def paint(self, painter: QPainter,
-                      option: QStyleOptionGraphicsItem,  # pylint: disable=unused-argument
-                      widget: Optional[QWidget]) -> None:  # pylint: disable=unused-argument
-                """
-                Paints the marble on the game board.
-                """
-                painter.drawPixmap(0, 0, self._pixmap)
+        _POSITIONS = _slot_positions(QPoint(IMAGE_OFFSET_X + 36, IMAGE_OFFSET_Y + 38),
+                                     MARBLE_SIZE + QSize(6, 6))
+        _LEFT_BOUND = IMAGE_OFFSET_X + MARBLE_SIZE.width() // 3
+        _RIGHT_BOUND = IMAGE_OFFSET_X + IMAGE_SIZE.width() - MARBLE_SIZE.width() // 3
+        _TOP_BOUND = IMAGE_OFFSET_Y + MARBLE_SIZE.height() // 3
+        _BOTTOM_BOUND = IMAGE_OFFSET_Y + IMAGE_SIZE.height() - MARBLE_SIZE.height() // 3
+        _INSERT_ORIGIN_X = IMAGE_OFFSET_X + 50
+        _INSERT_ORIGIN_Y = IMAGE_OFFSET_Y + 50
+        _INSERT_STEP_X = SLOT_SIZE.width() + 18
+        _INSERT_STEP_Y = SLOT_SIZE.height() + 18
 
         def __init__(self, animation_manager: _AnimationManager) -> None:
             """
             Initializes the BoardScene with the given animation manager.
             """
             super().__init__()
-            board_pixmap = load_image('shiftago_board.jpg').scaled(self.IMAGE_SIZE)
+            self._board_pixmap = load_image('shiftago_board.jpg').scaled(self.IMAGE_SIZE)
             self._marble_pixmaps: dict[Colour, QPixmap] = {
-                Colour.BLUE: load_image('blue_marble.png').scaled(self.Marble.SIZE),
-                Colour.ORANGE: load_image('orange_marble.png').scaled(self.Marble.SIZE)
+                Colour.BLUE: load_image('blue_marble.png').scaled(self.MARBLE_SIZE),
+                Colour.ORANGE: load_image('orange_marble.png').scaled(self.MARBLE_SIZE)
             }
             self.setSceneRect(0, 0, BOARD_VIEW_SIZE.width(), BOARD_VIEW_SIZE.height())
-            self.addPixmap(board_pixmap).setPos(QPoint(self.IMAGE_OFFSET_X, self.IMAGE_OFFSET_Y))
-            self._marbles: dict[Slot, BoardView.BoardScene.Marble] = {}
+            self._marbles: dict[Slot, QGraphicsPixmapItem] = {}
+            self._pending_shifts: list[tuple[QGraphicsPixmapItem, QPointF, QPointF]] = []
             self._winning_line_markers: dict[Slot, QGraphicsEllipseItem] = {}
             self._animation_manager = animation_manager
             self._move_selection_enabled: bool = False
 
+        @override
+        def drawBackground(self, painter: QPainter, rect: QRectF) -> None:  # pylint: disable=invalid-name
+            """
+            Draws the static game board image behind all marbles and markers.
+            """
+            super().drawBackground(painter, rect)
+            painter.drawPixmap(self.IMAGE_OFFSET_X, self.IMAGE_OFFSET_Y, self._board_pixmap)
+
         def insert_marble(self, slot: Slot, colour: Colour) -> None:
             """
             Inserts a marble into the specified slot with the given colour.
+            The marble shifts preceding the insertion are animated first, all at once.
             """
-            marble = self.Marble(self._marble_pixmaps[colour], self.position_of(slot))
+            if self._pending_shifts:
+                self._animation_manager.perform_in_parallel(
+                    ((_item_animation(marble.setPos, start_pos), end_pos)
+                     for marble, start_pos, end_pos in self._pending_shifts), 500)
+                self._pending_shifts.clear()
+            marble = QGraphicsPixmapItem(self._marble_pixmaps[colour])
+            marble.setPos(self.position_of(slot))
             self._marbles[slot] = marble
             marble.setOpacity(0.0)
             self.addItem(marble)
-            self._animation_manager.perform(QPropertyAnimation(marble, QByteArray(b'opacity')),
-                                            1.0, 500)
+            self._animation_manager.perform(_item_animation(marble.setOpacity, 0.0), 1.0, 500)
 
         def shift_marble(self, slot: Slot, direction: Side) -> None:
             """
             Shifts a marble from the specified slot in the given direction.
+            The animation is deferred until the insertion that completes the move.
             """
             target_slot = slot.neighbour(direction)
             marble = self._marbles.pop(slot)
             self._marbles[target_slot] = marble
-            self._animation_manager.perform(QPropertyAnimation(marble, QByteArray(b'pos')),
-                                            self.position_of(target_slot), 500)
+            self._pending_shifts.append((marble, self.position_of(slot), self.position_of(target_slot)))
 
         def reset(self) -> None:
             """
@@ -172,6 +212,7 @@ class BoardView(AppEventEmitter, QGraphicsView):
             for item in self._marbles.values():
                 self.removeItem(item)
             self._marbles.clear()
+            self._pending_shifts.clear()
             for item in self._winning_line_markers.values():
                 self.removeItem(item)
             self._winning_line_markers.clear()
@@ -186,18 +227,17 @@ class BoardView(AppEventEmitter, QGraphicsView):
                     if self._winning_line_markers.get(slot) is None:
                         pos = self.position_of(slot)
                         marker = QGraphicsEllipseItem(pos.x() - 2, pos.y() - 2,
-                                                      self.Marble.SIZE.width() + 2, self.Marble.SIZE.height() + 4)
+                                                      self.MARBLE_SIZE.width() + 2, self.MARBLE_SIZE.height() + 4)
                         marker.setPen(pen)
                         self._winning_line_markers[slot] = marker
                         self.addItem(marker)
 
         @classmethod
-        def position_of(cls, slot: Slot) -> QPoint:
+        def position_of(cls, slot: Slot) -> QPointF:
             """
             Returns the position of the given slot on the game board.
             """
-            return QPoint(cls.IMAGE_OFFSET_X + 36 + slot.hor_pos * (cls.Marble.SIZE.width() + 6),
-                          cls.IMAGE_OFFSET_Y + 38 + slot.ver_pos * (cls.Marble.SIZE.height() + 6))
+            return cls._POSITIONS[slot]
 
         @classmethod
         def determine_side(cls, cursor_pos: QPoint) -> Optional[Side]:
@@ -207,10 +247,10 @@ class BoardView(AppEventEmitter, QGraphicsView):
             cursor_pos_x = cursor_pos.x()
             cursor_pos_y = cursor_pos.y()
 
-            left_bound = cls.IMAGE_OFFSET_X + cls.Marble.SIZE.width() // 3
-            right_bound = cls.IMAGE_OFFSET_X + cls.IMAGE_SIZE.width() - cls.Marble.SIZE.width() // 3
-            top_bound = cls.IMAGE_OFFSET_Y + cls.Marble.SIZE.height() // 3
-            bottom_bound = cls.IMAGE_OFFSET_Y + cls.IMAGE_SIZE.height() - cls.Marble.SIZE.height() // 3
+            left_bound = cls._LEFT_BOUND
+            right_bound = cls._RIGHT_BOUND
+            top_bound = cls._TOP_BOUND
+            bottom_bound = cls._BOTTOM_BOUND
 
             if cursor_pos_x < left_bound:
                 if top_bound < cursor_pos_y < bottom_bound:
@@ -232,17 +272,13 @@ class BoardView(AppEventEmitter, QGraphicsView):
             Determines the insert position on the board based on the side and cursor position.
             """
             if side.is_vertical:
-                board_relative_pos = cursor_pos - (cls.IMAGE_OFFSET_Y + 50)
-                insert_pos = board_relative_pos // (cls.SLOT_SIZE.height() + 18)
-                if 0 <= insert_pos <= 6 and (
-                        board_relative_pos % (cls.SLOT_SIZE.height() + 18)) < cls.SLOT_SIZE.height():
-                    return insert_pos
+                insert_pos, offset = divmod(cursor_pos - cls._INSERT_ORIGIN_Y, cls._INSERT_STEP_Y)
+                slot_extent = cls.SLOT_SIZE.height()
             else:
-                board_relative_pos = cursor_pos - (cls.IMAGE_OFFSET_X + 50)
-                insert_pos = board_relative_pos // (cls.SLOT_SIZE.width() + 18)
-                if 0 <= insert_pos <= 6 and (
-                        board_relative_pos % (cls.SLOT_SIZE.width() + 18)) < cls.SLOT_SIZE.width():
-                    return insert_pos
+                insert_pos, offset = divmod(cursor_pos - cls._INSERT_ORIGIN_X, cls._INSERT_STEP_X)
+                slot_extent = cls.SLOT_SIZE.width()
+            if 0 <= insert_pos <= 6 and offset < slot_extent:
+                return insert_pos
             return None
 
     def __init__(self, model: BoardViewModel, main_window_title: str) -> None:
@@ -253,25 +289,32 @@ class BoardView(AppEventEmitter, QGraphicsView):
 
         self._board_scene = self.BoardScene(_AnimationManager(self))
         self.setScene(self._board_scene)
+        self.setCacheMode(QGraphicsView.CacheModeFlag.CacheBackground)
+        self.setViewportUpdateMode(QGraphicsView.ViewportUpdateMode.BoundingRectViewportUpdate)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontAdjustForAntialiasing, True)
+        self.setOptimizationFlag(QGraphicsView.OptimizationFlag.DontSavePainterState, True)
 
         model.connect_with(self._update_from_model)
         self._model = model
         self._main_window_title = main_window_title
 
         self._neutral_cursor = QCursor(Qt.CursorShape.ArrowCursor)
+        self._current_cursor: Optional[QCursor] = None
 
         cursor_hor_size = QSize(70, 122)
         cursor_ver_size = QSize(122, 70)
 
-        self._insert_cursors: dict[Colour, dict[Side, BoardView.CursorPair]] = defaultdict(dict)
+        # per colour, the disabled and the enabled insert cursor of each side, indexed by side.value * 2 + enabled
+        self._insert_cursors: dict[Colour, tuple[QCursor, ...]] = {}
         for colour in (Colour.BLUE, Colour.ORANGE):
             cn = colour.name.lower()
+            cursors: list[QCursor] = []
             for side in Side:
                 sn = side.name.lower()
                 csize = cursor_hor_size if side.is_horizontal else cursor_ver_size
-                self._insert_cursors[colour][side] = self.CursorPair(
-                    QCursor(load_image(f'insert_{cn}_{sn}_enabled.png').scaled(csize), -1, -1),
-                    QCursor(load_image(f'insert_{cn}_{sn}_disabled.png').scaled(csize), -1, -1))
+                cursors.append(QCursor(load_image(f'insert_{cn}_{sn}_disabled.png').scaled(csize), -1, -1))
+                cursors.append(QCursor(load_image(f'insert_{cn}_{sn}_enabled.png').scaled(csize), -1, -1))
+            self._insert_cursors[colour] = tuple(cursors)
 
     @property
     def model(self) -> BoardViewModel:
@@ -295,7 +338,7 @@ class BoardView(AppEventEmitter, QGraphicsView):
         self._move_selection_enabled = new_val
         self.setMouseTracking(new_val)
         if not new_val:
-            self.setCursor(self._neutral_cursor)
+            self._apply_cursor(self._neutral_cursor)
 
     @singledispatchmethod
     def _update_from_model(self, event: AppEvent) -> None:
@@ -334,13 +377,20 @@ class BoardView(AppEventEmitter, QGraphicsView):
         Handles the mouse move event to update the cursor based on the current state.
         """
         if self._move_selection_enabled:
-            assert self._model.whose_turn_it_is is not None, "current_player not set!"
             side, insert_pos = self._determine_move_args(ev.pos())
             new_cursor = self._neutral_cursor
             if side is not None:
-                cursor_pair = self._insert_cursors[self._model.whose_turn_it_is.colour][side]
-                new_cursor = cursor_pair.get(insert_pos is not None)
-            self.setCursor(new_cursor)
+                new_cursor = self._insert_cursors[self._model.whose_turn_it_is.colour][
+                    side.value * 2 + (insert_pos is not None)]
+            self._apply_cursor(new_cursor)
+
+    def _apply_cursor(self, cursor: QCursor) -> None:
+        """
+        Sets the given cursor unless it is already the current one.
+        """
+        if cursor is not self._current_cursor:
+            self._current_cursor = cursor
+            self.setCursor(cursor)
 
     @override
     def mousePressEvent(self, ev: QMouseEvent) -> None:  # pylint: disable=invalid-name
@@ -412,4 +462,4 @@ class BoardView(AppEventEmitter, QGraphicsView):
             msg_box.setInformativeText("That's the computer.")
         msg_box.setStandardButtons(QMessageBox.StandardButton.Ok)
         msg_box.exec_()
-        self.emit(ReadyForFirstMoveEvent())
+        self.emit(READY_FOR_FIRST_MOVE)
@@ -1,4 +1,11 @@
+import os
+import copy
+import signal
 import random
+import multiprocessing
+import multiprocessing.util
+from concurrent.futures import ProcessPoolExecutor, CancelledError
+from functools import lru_cache
 from typing import Optional, Tuple, Sequence, Set, override
 from enum import Enum
 from abc import ABC, abstractmethod
@@ -7,7 +14,52 @@ from shiftago.core import Colour, Slot, Side, Move, GameOverCondition, MoveObser
 from shiftago.core.express import ShiftagoExpress, SlotsInLine
 from shiftago.core.express_ai import SkillLevel, AlphaBetaPruning
 from shiftago.ui import AppEventEmitter
-from .app_events import MarbleShiftedEvent, MarbleInsertedEvent, BoardResetEvent
+from .app_events import MarbleShiftedEvent, MarbleInsertedEvent, BOARD_RESET
+
+
+@lru_cache(maxsize=None)
+def _ai_engine(skill_level: SkillLevel, max_workers: int) -> AlphaBetaPruning:
+    """
+    Returns the AI engine of the AI process, which is kept for all moves.
+    """
+    ai_engine = AlphaBetaPruning(skill_level, max_workers=max_workers)
+    # Unless the AI process is terminated (see _terminate_ai_process), the worker processes of the engine
+    # are shut down on exit, as a pool's own exit handler isn't run when a worker process like the AI process
+    # exits. This must happen before the queues to the workers are closed by their finalizers (exit priority 10).
+    multiprocessing.util.Finalize(ai_engine, ai_engine.shutdown, exitpriority=20)
+    return ai_engine
+
+
+def _terminate_ai_process(*_) -> None:
+    """
+    Handles SIGTERM in the AI process: terminates the worker processes of the AI engine, which would be
+    left behind otherwise, and exits without waiting for anything.
+    """
+    for process in multiprocessing.active_children():
+        process.terminate()
+    os._exit(0)  # pylint: disable=protected-access
+
+
+def _init_ai_process() -> None:
+    """
+    Initializes the AI process.
+    """
+    signal.signal(signal.SIGTERM, _terminate_ai_process)
+
+
+def _prepare_ai_engine(skill_level: SkillLevel, max_workers: int) -> None:
+    """
+    Creates the AI engine of the AI process in advance, so that the AI's first move doesn't have to wait for it.
+    """
+    _ai_engine(skill_level, max_workers)
+
+
+def _ai_select_move(skill_level: SkillLevel, max_workers: int, game_state: ShiftagoExpress) -> Move:
+    """
+    Selects the best move for the AI based on the given game state. This function is executed
+    by the AI process, so that the search doesn't compete with the UI for the GIL.
+    """
+    return _ai_engine(skill_level, max_workers).select_move(game_state)
 
 
 class PlayerNature(Enum):
@@ -106,7 +158,7 @@ class BoardViewModel(AppEventEmitter, ABC, MoveObserver):
         """
         Notifies the view that the board been has been reset.
         """
-        self.emit(BoardResetEvent())
+        self.emit(BOARD_RESET)
 
     def player_of(self, colour: Colour) -> Player:
         """
@@ -146,9 +198,17 @@ class ShiftagoExpressModel(BoardViewModel):
         """
         super().__init__()
         self._players = players
+        self._players_by_colour = {player.colour: player for player in players}
         core_model = ShiftagoExpress(colours=self._randomize_player_sequence())
         self._core_model = core_model
-        self._ai_engine = AlphaBetaPruning(config.skill_level)
+        self._skill_level = config.skill_level
+        self._max_ai_workers = config.ai_workers
+        # The AI searches in a process of its own. It is started right away, so that it is ready
+        # by the time the AI makes its first move.
+        self._ai_process = ProcessPoolExecutor(1, mp_context=multiprocessing.get_context('spawn'),
+                                               initializer=_init_ai_process)
+        self._ai_shut_down = False
+        self._ai_process.submit(_prepare_ai_engine, self._skill_level, self._max_ai_workers)
 
     @property
     @override
@@ -158,11 +218,15 @@ class ShiftagoExpressModel(BoardViewModel):
     @property
     @override
     def whose_turn_it_is(self) -> Player:
-        return self.player_of(self._core_model.colour_to_move)
+        return self._players_by_colour[self._core_model.colour_to_move]
+
+    @override
+    def player_of(self, colour: Colour) -> Player:
+        return self._players_by_colour[colour]
 
     @property
     def skill_level(self) -> SkillLevel:
-        return self._ai_engine.skill_level
+        return self._skill_level
 
     @property
     @override
@@ -212,8 +276,32 @@ class ShiftagoExpressModel(BoardViewModel):
         """
         self._core_model.apply_move(move, self)
 
-    def ai_select_move(self) -> Move:
+    def shutdown(self) -> None:
         """
-        Selects the best move for the AI based on the current game state.
+        Shuts down the AI process, including the worker processes of its AI engine, without waiting for
+        a search in progress: the AI process is terminated, so that a pending ai_select_move returns None.
+        The AI can't select any moves anymore afterwards.
         """
-        return self._ai_engine.select_move(self._core_model)
+        self._ai_shut_down = True
+        self._ai_process.shutdown(wait=False, cancel_futures=True)
+        # the AI process is the only child process; it terminates the worker processes of its AI engine itself
+        for process in multiprocessing.active_children():
+            process.terminate()
+
+    def ai_select_move(self) -> Optional[Move]:
+        """
+        Selects the best move for the AI based on the current game state.
+
+        Returns:
+        The selected move, or None if the AI has been shut down meanwhile.
+        """
+        # The game state is pickled later by a thread of the executor, so a snapshot is submitted
+        # that a concurrent reset of the model can't change.
+        game_state = copy.copy(self._core_model)
+        try:
+            return self._ai_process.submit(_ai_select_move, self._skill_level, self._max_ai_workers,
+                                           game_state).result()
+        except (RuntimeError, CancelledError):  # RuntimeError includes BrokenProcessPool
+            if self._ai_shut_down:
+                return None
+            raise
@@ -11,7 +11,8 @@ from shiftago.app_config import ShiftagoConfig
 from shiftago.core import Colour
 from shiftago.ui import load_image, Controller, AppEvent, AppEventEmitter
 from .board_view import BoardView, BOARD_VIEW_SIZE
-from .app_events import NewGameRequestedEvent, ScreenshotRequestedEvent, AppInfoRequestedEvent, ExitRequestedEvent
+from .app_events import NewGameRequestedEvent, ScreenshotRequestedEvent, AppInfoRequestedEvent, ExitRequestedEvent, \
+    NEW_GAME_REQUESTED, SCREENSHOT_REQUESTED, APP_INFO_REQUESTED, EXIT_REQUESTED
 from .game_model import ShiftagoExpressModel, PlayerNature, Player
 from .board_controller import BoardController
 
@@ -46,18 +47,18 @@ class _MainWindow(AppEventEmitter, QMainWindow):
         self.setCentralWidget(self._board_view)
         menu_bar = self.menuBar()
         game_menu = menu_bar.addMenu('&Game')
-        game_menu.addAction('New game', lambda: self.emit(NewGameRequestedEvent()))
+        game_menu.addAction('New game', lambda: self.emit(NEW_GAME_REQUESTED))
 
         screenshot_action = QAction(QIcon(load_image('screenshot-icon.png')), '&Screenshot', self)
-        screenshot_action.triggered.connect(lambda: self.emit(ScreenshotRequestedEvent()))
+        screenshot_action.triggered.connect(lambda: self.emit(SCREENSHOT_REQUESTED))
         game_menu.addAction(screenshot_action)
 
         about_action = QAction(QIcon(load_image('info-icon.png')), '&About', self)
-        about_action.triggered.connect(lambda: self.emit(AppInfoRequestedEvent()))
+        about_action.triggered.connect(lambda: self.emit(APP_INFO_REQUESTED))
         game_menu.addAction(about_action)
 
         exit_action = QAction(QIcon(load_image('exit-icon.png')), '&Exit', self)
-        exit_action.triggered.connect(lambda: self.emit(ExitRequestedEvent()))
+        exit_action.triggered.connect(lambda: self.emit(EXIT_REQUESTED))
         game_menu.addAction(exit_action)
 
         self._exit_confirmed = False
@@ -69,7 +70,7 @@ class _MainWindow(AppEventEmitter, QMainWindow):
         """
         if not self._exit_confirmed:
             event.ignore()
-            self.emit(ExitRequestedEvent())
+            self.emit(EXIT_REQUESTED)
 
     def confirm_new_game(self) -> bool:
         """
@@ -20,7 +20,7 @@ class AlphaBetaPruningTest(unittest.TestCase):
         with TestDataLoader(ShiftagoExpress, 'board3.json') as express_game:
             of_blue, of_orange = analyze_colour_placements(express_game)
             print("\nBLUE:")
-            for match_group_index, match_group_count in of_blue.items():
+            for match_group_index, match_group_count in enumerate(of_blue):
                 print("{0}: {1}".format(match_group_index, match_group_count))
             self.assertEqual(0, of_blue[5])
             self.assertEqual(1, of_blue[4])
@@ -28,7 +28,7 @@ class AlphaBetaPruningTest(unittest.TestCase):
             self.assertEqual(1, of_blue[2])
             self.assertEqual(0, of_blue[1])
             print("ORANGE:")
-            for match_group_index, match_group_count in of_orange.items():
+            for match_group_index, match_group_count in enumerate(of_orange):
                 print("{0}: {1}".format(match_group_index, match_group_count))
             self.assertEqual(0, of_orange[5])
             self.assertEqual(2, of_orange[4])
@@ -57,6 +57,17 @@ class AlphaBetaPruningTest(unittest.TestCase):
                 self.assertIn(move, (Move(Side.TOP, 1), Move(Side.TOP, 4)))
                 print("Move: {0}".format(move))
 
+    def test_2_alpha_beta_pruning_in_parallel(self):
+        with TestDataLoader(ShiftagoExpress, 'express_ai_test2.json') as express_game:
+            print("\n{0}".format(express_game))
+            ai_engine = AlphaBetaPruning(SkillLevel.GRANDMASTER, max_workers=2)
+            try:
+                move = ai_engine.select_move(express_game)
+            finally:
+                ai_engine.shutdown()
+            self.assertIn(move, (Move(Side.TOP, 1), Move(Side.TOP, 4)))
+            print("Move: {0}".format(move))
+
     def test_3_alpha_beta_pruning(self):
         with TestDataLoader(ShiftagoExpress, 'express_ai_test3.json') as express_game:
             print("\n{0}".format(express_game))
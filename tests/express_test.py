@@ -1,8 +1,9 @@
 # pylint: disable=consider-using-f-string
 import copy
+import random
 import unittest
 from shiftago.core import NUM_SLOTS_PER_SIDE, Colour, Slot, Move, Side, LineOrientation, SlotsInLine
-from shiftago.core.express import ShiftagoExpress
+from shiftago.core.express import ShiftagoExpress, GAME_ONGOING, GAME_WON
 from tests import TestDataLoader
 
 
@@ -64,3 +65,63 @@ class ShiftagoExpressTest(unittest.TestCase):
             self.assertEqual(Colour.ORANGE, express_game.colour_at(Slot(1, 3)))
             self.assertEqual(Colour.GREEN, express_game.colour_at(Slot(2, 3)))
             self.assertEqual(Colour.GREEN, express_game.colour_at(Slot(3, 3)))
+
+    def test_zobrist_key(self):
+        with TestDataLoader(ShiftagoExpress, 'board2.json') as express_game:
+            for move in (Move(Side.TOP, 2), Move(Side.BOTTOM, 5), Move(Side.RIGHT, 2), Move(Side.LEFT, 3)):
+                express_game.apply_move(move)
+                rebuilt_game = ShiftagoExpress(colours=express_game.colours,
+                                               board={slot: colour for slot, colour in express_game.slots()
+                                                      if colour is not None})
+                self.assertEqual(rebuilt_game.zobrist_key, express_game.zobrist_key)
+                for colour in Colour:
+                    self.assertEqual(rebuilt_game.bitboard(colour), express_game.bitboard(colour))
+            game_to_move_next = copy.copy(express_game)
+            game_to_move_next.colours.rotate(-1)
+            self.assertNotEqual(game_to_move_next.zobrist_key, express_game.zobrist_key)
+
+    def test_undo_move(self):
+        with TestDataLoader(ShiftagoExpress, 'board2.json') as express_game:
+            orig_game = copy.copy(express_game)
+            moves = (Move(Side.TOP, 2), Move(Side.BOTTOM, 5), Move(Side.RIGHT, 2), Move(Side.LEFT, 3))
+            for move in moves:
+                express_game.make_move(move)
+            for _ in moves:
+                express_game.undo_move()
+            self.assertEqual(orig_game, express_game)
+            self.assertEqual(orig_game.zobrist_key, express_game.zobrist_key)
+            for colour in Colour:
+                self.assertEqual(orig_game.bitboard(colour), express_game.bitboard(colour))
+            self.assertRaises(IndexError, express_game.undo_move)
+
+    def test_game_status(self):
+        rnd = random.Random(4711)
+        for _ in range(20):
+            express_game = ShiftagoExpress(colours=(Colour.BLUE, Colour.ORANGE))
+            game_status = GAME_ONGOING
+            while game_status == GAME_ONGOING:
+                colour_to_move = express_game.colour_to_move
+                game_status = express_game.make_move(rnd.choice(express_game.detect_all_possible_moves()))
+                has_winning_line = len(express_game.detect_winning_lines()[
+                    list(express_game.colours).index(colour_to_move)]) > 0
+                self.assertEqual(game_status == GAME_WON, has_winning_line)
+            if game_status == GAME_WON:
+                # right after the winning move, before the game over condition has been requested
+                self.assertEqual(express_game.winning_lines_of_winner(), set(express_game.detect_winning_lines()[
+                    list(express_game.colours).index(colour_to_move)]))
+
+    def test_count_matches(self):
+        with TestDataLoader(ShiftagoExpress, 'board2.json') as express_game:
+            for min_match_count in range(1, express_game.winning_line_length + 1):
+                for match_counts, winning_lines in zip(express_game.count_matches(min_match_count),
+                                                       express_game.detect_winning_lines(min_match_count)):
+                    for match_degree, match_count in enumerate(match_counts):
+                        self.assertEqual(sum(1 for degree in winning_lines.values() if degree == match_degree),
+                                         match_count)
+
+    def test_sample_possible_move(self):
+        with TestDataLoader(ShiftagoExpress, 'board2.json') as express_game:
+            rnd = random.Random(4711)
+            possible_moves = express_game.detect_all_possible_moves()
+            sampled_moves = {express_game.sample_possible_move(rnd) for _ in range(1000)}
+            self.assertEqual(set(possible_moves), sampled_moves)